@@ -1,10 +1,13 @@
 # auth/google_auth.py
 
 import asyncio
+import functools
 import json
 import jwt
 import logging
+import orjson
 import os
+import threading
 import time
 
 from datetime import datetime, timedelta
@@ -14,8 +17,11 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 from auth.scopes import OAUTH_STATE_TO_SESSION_ID_MAP, SCOPES
 
 # Configure logging
@@ -45,6 +51,10 @@ DEFAULT_CREDENTIALS_DIR = get_default_credentials_dir()
 # This is brittle and bad, but our options are limited with Claude in present state.
 # This should be more robust in a production system once OAuth2.1 is implemented in client.
 _SESSION_CREDENTIALS_CACHE: Dict[str, Credentials] = {}
+# Header credentials refreshed by get_credentials, reused until a minute before
+# expiry: {(client_id, client_secret, refresh_token, scopes): Credentials}
+_HEADER_CREDENTIALS_CACHE: Dict[Tuple[str, str, str, Tuple[str, ...]], Credentials] = {}
+_HEADER_CREDENTIALS_CACHE_SIZE = 256
 # Centralized Client Secrets Path Logic
 _client_secrets_env = os.getenv("GOOGLE_CLIENT_SECRET_PATH") or os.getenv(
     "GOOGLE_CLIENT_SECRETS"
@@ -1109,7 +1119,17 @@ def get_credentials(
     """
     # Priority 1: Try to create credentials from header parameters first
     if client_id and client_secret and refresh_token:
-        
+        # Reuse the access token from an earlier call instead of refreshing every time
+        cache_key = (client_id, client_secret, refresh_token, tuple(sorted(required_scopes)))
+        cached_credentials = _HEADER_CREDENTIALS_CACHE.get(cache_key)
+        if (
+            cached_credentials is not None
+            and cached_credentials.valid
+            and not _is_token_expiring_soon(cached_credentials, minutes_threshold=1)
+        ):
+            logger.debug(f"[get_credentials] Reusing cached header credentials. Session: '{session_id}'")
+            return cached_credentials
+
         try:
             header_credentials = Credentials(
                 token=None,  # Will be refreshed if needed
@@ -1133,6 +1153,9 @@ def get_credentials(
                 logger.info(
                     f"[get_credentials] Successfully using header credentials. User: '{user_google_email}', Session: '{session_id}'"
                 )
+                if len(_HEADER_CREDENTIALS_CACHE) >= _HEADER_CREDENTIALS_CACHE_SIZE:
+                    _HEADER_CREDENTIALS_CACHE.pop(next(iter(_HEADER_CREDENTIALS_CACHE)), None)
+                _HEADER_CREDENTIALS_CACHE[cache_key] = refreshed_credentials
                 return refreshed_credentials
             else:
                 logger.warning(
@@ -1328,6 +1351,57 @@ def get_user_info(credentials: Credentials) -> Optional[Dict[str, Any]]:
 # --- Centralized Google Service Authentication ---
 
 
+class _ThreadLocalHttp:
+    """
+    httplib2.Http stand-in that keeps one connection pool per thread.
+
+    httplib2 is not thread-safe, but tool calls execute on long-lived
+    asyncio.to_thread workers, so a per-thread Http lets consecutive calls
+    reuse keep-alive connections instead of paying a fresh TLS handshake.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _http(self):
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = build_http()
+        return http
+
+    def request(self, *args, **kwargs):
+        return self._http().request(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._http(), name)
+
+
+# Shared by every service built below; credentials are bound per service
+_POOLED_HTTP = _ThreadLocalHttp()
+
+
+@functools.lru_cache(maxsize=16)
+def _get_discovery_document(service_name: str, version: str) -> Optional[str]:
+    """
+    Read the discovery document bundled with googleapiclient, once per process.
+
+    build() re-reads this file (hundreds of KB) on every call. Returns None for
+    APIs without a bundled document, which must go through build() instead.
+    """
+    return discovery_cache.get_static_doc(service_name, version)
+
+
+def _build_service(service_name: str, version: str, credentials: Credentials):
+    """Build a service over the pooled transport, from the cached discovery document if bundled."""
+    http = AuthorizedHttp(credentials, http=_POOLED_HTTP)
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        return build(service_name, version, http=http)
+
+    # Parsed fresh per build: googleapiclient fills in method parameters in place
+    return build_from_document(orjson.loads(document), http=http)
+
+
 class GoogleAuthenticationError(Exception):
     """Exception raised when Google authentication is required or fails."""
 
@@ -1411,7 +1485,7 @@ async def get_authenticated_google_service(
         raise GoogleAuthenticationError(auth_response)
 
     try:
-        service = build(service_name, version, credentials=credentials)
+        service = _build_service(service_name, version, credentials)
         log_user_email = None
 
         # Try to get email from credentials if needed for validation
@@ -1,3 +1,4 @@
+import hashlib
 import inspect
 import logging
 from functools import wraps
@@ -84,6 +85,7 @@ SCOPE_GROUPS = {
 # Service cache: {cache_key: (service, cached_time, user_email)}
 _service_cache: Dict[str, tuple[Any, datetime, str]] = {}
 _cache_ttl = timedelta(minutes=30)  # Cache services for 30 minutes
+_cache_max_entries = 256  # Oldest entries are evicted beyond this
 
 
 def _get_cache_key(user_email: str, service_name: str, version: str, scopes: List[str]):
@@ -92,6 +94,11 @@ def _get_cache_key(user_email: str, service_name: str, version: str, scopes: Lis
     return f"{user_email}:{service_name}:{version}:{':'.join(sorted_scopes)}"
 
 
+def _get_credentials_fingerprint(client_id: str, refresh_token: str) -> str:
+    """Identify the user behind header credentials without putting the token in cache keys."""
+    return hashlib.sha256(f"{client_id}:{refresh_token}".encode()).hexdigest()
+
+
 def _is_cache_valid(cached_time: datetime) -> bool:
     """Check if cached service is still valid."""
     return datetime.now() - cached_time < _cache_ttl
@@ -113,6 +120,9 @@ def _get_cached_service(cache_key: str) -> Optional[tuple[Any, str]]:
 
 def _cache_service(cache_key: str, service: Any, user_email: str) -> None:
     """Cache a service instance."""
+    _service_cache.pop(cache_key, None)
+    if len(_service_cache) >= _cache_max_entries:
+        del _service_cache[next(iter(_service_cache))]
     _service_cache[cache_key] = (service, datetime.now(), user_email)
     logger.debug(f"Cached service for key: {cache_key}")
 
@@ -265,15 +275,20 @@ def require_google_service(
             # Resolve scopes
             resolved_scopes = _resolve_scopes(scopes)
 
-            # --- Service Caching and Authentication Logic (largely unchanged) ---
+            # --- Service Caching and Authentication Logic ---
             service = None
-            # actual_user_email = user_google_email
-            #
-            # if cache_enabled:
-            #     cache_key = _get_cache_key(user_google_email, service_name, service_version, resolved_scopes)
-            #     cached_result = _get_cached_service(cache_key)
-            #     if cached_result:
-            #         service, actual_user_email = cached_result
+            cache_key = None
+
+            # Only header credentials identify the user, so only those services are cached.
+            # The cached service's credentials refresh themselves when they expire.
+            if cache_enabled and client_id and client_secret and refresh_token:
+                cache_key = _get_cache_key(
+                    _get_credentials_fingerprint(client_id, refresh_token),
+                    service_name, service_version, resolved_scopes
+                )
+                cached_result = _get_cached_service(cache_key)
+                if cached_result:
+                    service, actual_user_email = cached_result
 
             if service is None:
                 try:
@@ -287,9 +302,8 @@ def require_google_service(
                         client_secret=client_secret,
                         refresh_token=refresh_token,
                     )
-                    # if cache_enabled:
-                    #     cache_key = _get_cache_key(user_google_email, service_name, service_version, resolved_scopes)
-                    #     _cache_service(cache_key, service, actual_user_email)
+                    if cache_key:
+                        _cache_service(cache_key, service, actual_user_email)
                 except GoogleAuthenticationError as e:
                     raise Exception(str(e))
 
@@ -298,6 +312,9 @@ def require_google_service(
                 # Prepend the fetched service object to the original arguments
                 return await func(service, *args, **kwargs)
             except RefreshError as e:
+                # Don't hand out a service whose token can no longer be refreshed
+                if cache_key:
+                    _service_cache.pop(cache_key, None)
                 # error_message = _handle_token_refresh_error(e, service_name)
                 raise Exception(f"refresh error") from e
 
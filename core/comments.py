@@ -5,6 +5,7 @@ This module provides reusable comment management functions for Google Workspace
 All Google Workspace apps (Docs, Sheets, Slides) use the Drive API for comment operations.
 """
 
+import functools
 import logging
 import asyncio
 from typing import Dict, Any, Optional
@@ -20,10 +21,15 @@ from core.utils import handle_http_errors
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
 def create_comment_tools(app_name: str, file_id_param: str):
     """
     Factory function to create comment management tools for a specific Google Workspace app.
 
+    Cached per (app_name, file_id_param), so module reloads reuse the tools
+    instead of building and registering them again. Callers must not modify
+    the returned dict.
+
     Args:
         app_name: Name of the app (e.g., "document", "spreadsheet", "presentation")
         file_id_param: Parameter name for the file ID (e.g., "document_id", "spreadsheet_id", "presentation_id")
@@ -7,12 +7,14 @@ import logging
 import asyncio
 import io
 import json
+import functools
 from typing import List, Optional, Dict, Any, Union, Literal
 from uuid import uuid4
 from pydantic import BaseModel, Field
 
 from mcp import types
 from fastmcp import Context
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload, HttpRequest
 
 # Auth & server utilities
@@ -166,6 +168,9 @@ def process_tabs_recursively(tabs: List, level: int = 0, target_tab_id: Optional
         List[TabContent]: List of processed tab objects (Pydantic models)
     """
     processed_tabs: List[TabContent] = []
+    # Local aliases keep the attribute lookups out of the per-tab loop
+    append_tab = processed_tabs.append
+    extend_tabs = processed_tabs.extend
     inline_objects = inline_objects or {}
     
     for i, tab in enumerate(tabs):
@@ -175,16 +180,10 @@ def process_tabs_recursively(tabs: List, level: int = 0, target_tab_id: Optional
 
         # If target_tab_id is specified, skip tabs that don't match
         if target_tab_id and tab_id != target_tab_id:
-            # Still check child tabs recursively
-            child_tabs = tab.get('childTabs', [])
-            if child_tabs:
-                child_tab_results = process_tabs_recursively(child_tabs, level + 1, target_tab_id, inline_objects)
-                processed_tabs.extend(child_tab_results)
-
-            nested_tabs = tab.get('tabs', [])
-            if nested_tabs:
-                nested_tab_results = process_tabs_recursively(nested_tabs, level + 1, target_tab_id, inline_objects)
-                processed_tabs.extend(nested_tab_results)
+            # Still check child tabs (both API shapes) recursively
+            for nested_tabs in (tab.get('childTabs'), tab.get('tabs')):
+                if nested_tabs:
+                    extend_tabs(process_tabs_recursively(nested_tabs, level + 1, target_tab_id, inline_objects))
             continue
 
         logger.info(f"[process_tabs_recursively] Processing tab at level {level}: '{tab_title}' (ID: {tab_id})")
@@ -212,20 +211,16 @@ def process_tabs_recursively(tabs: List, level: int = 0, target_tab_id: Optional
         nested_tabs = tab.get('tabs', [])
         if nested_tabs:
             logger.info(f"[process_tabs_recursively] Tab '{tab_title}' has {len(nested_tabs)} nested tabs")
-            nested_tab_results = process_tabs_recursively(nested_tabs, level + 1, target_tab_id, inline_objects)
-            child_tab_list.extend(nested_tab_results)
+            child_tab_list.extend(process_tabs_recursively(nested_tabs, level + 1, target_tab_id, inline_objects))
 
-        # Create TabContent object
-        tab_obj = TabContent(
+        append_tab(TabContent(
             tabId=tab_id,
             title=tab_title,
             level=level,
             index=i + 1,
             content=content_blocks,
             childTabs=child_tab_list
-        )
-
-        processed_tabs.append(tab_obj)
+        ))
 
     return processed_tabs
 
@@ -663,15 +658,17 @@ async def list_docs_in_folder(
     )
 
 
-def markdown_to_html(markdown_text: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _get_markdown_converter():
     """
-    Convert Markdown text to HTML using the markdown library.
+    Build the shared Markdown converter once.
 
-    Args:
-        markdown_text: Markdown formatted text
+    Loading the extensions is the expensive part of a conversion, so a single
+    instance is reused and reset between documents instead of being rebuilt
+    on every call.
 
     Returns:
-        HTML string with styling
+        markdown.Markdown instance configured for Google Docs HTML import
     """
     try:
         import markdown
@@ -681,9 +678,7 @@ def markdown_to_html(markdown_text: str) -> str:
             "Please install it with: pip install markdown"
         )
 
-    # Convert markdown to HTML with extensions
-    html_content = markdown.markdown(
-        markdown_text,
+    return markdown.Markdown(
         extensions=[
             'extra',  # Tables, fenced code, etc.
             'nl2br',  # Newline to <br>
@@ -691,6 +686,20 @@ def markdown_to_html(markdown_text: str) -> str:
         ]
     )
 
+
+def markdown_to_html(markdown_text: str) -> str:
+    """
+    Convert Markdown text to HTML using the markdown library.
+
+    Args:
+        markdown_text: Markdown formatted text
+
+    Returns:
+        HTML string with styling
+    """
+    # Convert markdown to HTML with extensions (converter state is reset per document)
+    html_content = _get_markdown_converter().reset().convert(markdown_text)
+
     # Fix image sizes using multiple strategies for maximum Google Docs compatibility
     # Google Docs standard page width is ~468 PT (6.5 inches)
     import re
@@ -871,10 +880,12 @@ async def fix_image_sizes_in_doc(
     """
     try:
         # Get document to check for images
+        # Only inline objects are inspected, so skip the document body in the response
         doc = await asyncio.to_thread(
             docs_service.documents().get(
                 documentId=document_id,
-                includeTabsContent=False
+                includeTabsContent=False,
+                fields='inlineObjects'
             ).execute
         )
 
@@ -951,6 +962,55 @@ async def fix_image_sizes_in_doc(
         return 0
 
 
+def _send_multipart_upload(
+    drive_service,
+    method: str,
+    url: str,
+    params: Dict[str, str],
+    body: str,
+    boundary: str
+) -> Dict[str, Any]:
+    """
+    Send a multipart upload through the Drive service's authorized HTTP client.
+
+    Reusing the service's client keeps the connection to googleapis.com alive
+    between uploads and lets google-auth refresh the token on a 401, instead of
+    opening a fresh urllib connection for every document.
+
+    Args:
+        drive_service: Authenticated Google Drive service
+        method: HTTP method ('POST' to create, 'PATCH' to update)
+        url: Drive upload endpoint
+        params: Query string parameters
+        body: Multipart request body
+        boundary: Multipart boundary used in the body
+
+    Returns:
+        Parsed JSON response
+
+    Raises:
+        HttpError: If Drive returns a non-2xx status
+    """
+    import urllib.parse
+
+    full_url = url + '?' + urllib.parse.urlencode(params)
+    headers = {
+        'Content-Type': f'multipart/related; boundary={boundary}'
+    }
+
+    response, content = drive_service._http.request(
+        full_url,
+        method=method,
+        body=body.encode('utf-8'),
+        headers=headers
+    )
+
+    if response.status >= 300:
+        raise HttpError(response, content, uri=full_url)
+
+    return json.loads(content.decode('utf-8'))
+
+
 async def create_doc_from_html(
     drive_service,
     title: str,
@@ -1010,38 +1070,9 @@ async def create_doc_from_html(
         'fields': 'id,webViewLink'
     }
 
-    # Create request
-    http = drive_service._http
-    headers = {
-        'Content-Type': f'multipart/related; boundary={boundary}'
-    }
-
-    # Execute request in thread
-    def _execute_upload():
-        import urllib.parse
-        import urllib.request
-
-        # Build full URL
-        full_url = url + '?' + urllib.parse.urlencode(params)
-
-        # Create request
-        req = urllib.request.Request(
-            full_url,
-            data=body.encode('utf-8'),
-            headers=headers,
-            method='POST'
-        )
-
-        # Add authorization header
-        credentials = drive_service._http.credentials
-        credentials.apply(headers)
-        req.headers.update(headers)
-
-        # Execute
-        response = urllib.request.urlopen(req)
-        return json.loads(response.read().decode('utf-8'))
-
-    result = await asyncio.to_thread(_execute_upload)
+    result = await asyncio.to_thread(
+        _send_multipart_upload, drive_service, 'POST', url, params, body, boundary
+    )
 
     logger.info(f"[create_doc_from_html] Created document: {result.get('id')}")
 
@@ -1109,8 +1140,12 @@ async def create_doc(
         link = result.get('webViewLink', f"https://docs.google.com/document/d/{doc_id}/edit")
 
         # Post-processing: Fix oversized images using Docs API
-        logger.info(f"[create_doc] Checking and fixing image sizes...")
-        await fix_image_sizes_in_doc(docs_service, doc_id, target_width=350, max_threshold=450)
+        # (skipped when the HTML has no images, saving a full document fetch)
+        if '<img' in html_content:
+            logger.info(f"[create_doc] Checking and fixing image sizes...")
+            await fix_image_sizes_in_doc(docs_service, doc_id, target_width=350, max_threshold=450)
+        else:
+            logger.info(f"[create_doc] No images in content, skipping image size check")
 
     msg = f"Created Google Doc '{title}' (ID: {doc_id}) for {user_google_email}. Link: {link}"
     logger.info(f"[create_doc] {msg}")
@@ -1622,34 +1657,12 @@ async def append_html_to_doc(
     body = '\r\n'.join(body_parts)
 
     # Upload update
-    def _update_doc():
-        import urllib.parse
-        import urllib.request
-
-        url = f'https://www.googleapis.com/upload/drive/v3/files/{document_id}'
-        params = {'uploadType': 'multipart'}
-        full_url = url + '?' + urllib.parse.urlencode(params)
+    url = f'https://www.googleapis.com/upload/drive/v3/files/{document_id}'
+    params = {'uploadType': 'multipart'}
 
-        headers = {
-            'Content-Type': f'multipart/related; boundary={boundary}'
-        }
-
-        req = urllib.request.Request(
-            full_url,
-            data=body.encode('utf-8'),
-            headers=headers,
-            method='PATCH'
-        )
-
-        # Add authorization
-        credentials = drive_service._http.credentials
-        credentials.apply(headers)
-        req.headers.update(headers)
-
-        response = urllib.request.urlopen(req)
-        return json.loads(response.read().decode('utf-8'))
-
-    result = await asyncio.to_thread(_update_doc)
+    result = await asyncio.to_thread(
+        _send_multipart_upload, drive_service, 'PATCH', url, params, body, boundary
+    )
 
     logger.info(f"[append_html_to_doc] Document updated successfully")
 
@@ -4,38 +4,144 @@ Markdown to Google Slides Parser
 Parses Markdown content into structured slide data for Google Slides creation.
 """
 
+import html
 import logging
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
-from markdown_it import MarkdownIt
-from markdown_it.token import Token
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Recent parse results by markdown text, least recently used first
+_PARSE_CACHE_SIZE = 128
+_parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+# Block-level patterns, compiled once and matched against stripped lines
+_HEADING_RE = re.compile(r"(#{1,6})(?:[ \t]+(.*?))??(?:[ \t]+#+)?[ \t]*$")
+_ORDERED_ITEM_RE = re.compile(r"(\d{1,9})([.)])(?:[ \t]+|$)")
+_THEMATIC_BREAK_RE = re.compile(r"(?:(?:\*[ \t]*){3,}|(?:-[ \t]*){3,}|(?:_[ \t]*){3,})$")
+_SETEXT_UNDERLINE_RE = re.compile(r"(=+|-+)[ \t]*$")
+
+# First characters that can open a block construct; any other line is plain text
+_BLOCK_START_CHARS = frozenset(">#`~=-*_+0123456789[<")
+
+# Pieces of inline links and images. Labels may nest one level of brackets
+# ([alt [x]]) and bare destinations two levels of parentheses (a_(b).png)
+_LABEL = r"(?:[^\[\]\\]|\\.|\[(?:[^\[\]\\]|\\.)*\])*"
+_DESTINATION = r"<[^<>\n]*>|(?:[^\s()\\]|\\.|\((?:[^\s()\\]|\\.|\([^\s()\\]*\))*\))*"
+_TITLE = r"""(?:\s+(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|\((?:[^()\\]|\\.)*\)))?"""
+
+# Raw HTML tags and comments, which never reach a slide
+_HTML_TAG = (
+    r"<[A-Za-z][A-Za-z0-9-]*"
+    r"""(?:\s+[A-Za-z_:][\w.:-]*(?:\s*=\s*(?:[^\s"'=<>`]+|'[^']*'|"[^"]*"))?)*\s*/?>"""
+    r"|</[A-Za-z][A-Za-z0-9-]*\s*>"
+    r"|<!--.*?-->"
+)
+_AUTOLINK = (
+    r"[A-Za-z][A-Za-z0-9+.-]{1,31}:[^\s<>]*"
+    r"|[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+@[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?"
+    r"(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?)*"
+)
+
+# Single-pass inline tokenizer, dispatched on match.lastgroup. The reference
+# forms ([text][label], [text][], [text]) only count when the label is defined
+_INLINE_RE = re.compile(
+    rf"(?P<image>!\[(?P<image_alt>{_LABEL})\]\(\s*(?P<image_url>{_DESTINATION}){_TITLE}\s*\))"
+    rf"|(?P<ref_image>!\[(?P<ref_image_alt>{_LABEL})\](?:\[(?P<ref_image_label>{_LABEL})\])?)"
+    r"|(?P<code>(?P<ticks>`+)(?P<code_text>.+?)(?<!`)(?P=ticks)(?!`))"
+    rf"|(?P<link>\[(?P<link_text>{_LABEL})\]\(\s*(?:{_DESTINATION}){_TITLE}\s*\))"
+    rf"|(?P<ref_link>\[(?P<ref_link_text>{_LABEL})\](?:\[(?P<ref_link_label>{_LABEL})\])?)"
+    rf"|(?P<autolink><(?P<autolink_url>{_AUTOLINK})>)"
+    rf"|(?P<html>{_HTML_TAG})"
+    r"|(?P<escape>\\(?P<escaped>[!-/:-@\[-`{-~]))"
+    r"|(?P<entity>&(?:#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6}|[A-Za-z][A-Za-z0-9]{1,31});)"
+    r"|(?P<text>[^!`\[\\&<]+|.)",
+    re.DOTALL,
+)
+
+# Link reference definitions: [label]: destination "optional title"
+_REFERENCE_DEFINITION_RE = re.compile(
+    rf"^ {{0,3}}\[(?P<label>{_LABEL})\]:[ \t]*(?P<destination><[^<>\n]*>|\S+)"
+    r"""(?:[ \t]+(?:"[^"\n]*"|'[^'\n]*'|\([^()\n]*\)))?[ \t]*$""",
+    re.MULTILINE,
+)
+
+# HTML blocks, which are dropped whole: raw-text tags run to their closing tag,
+# block-level tags (and a lone tag on its own line) to the next blank line
+_HTML_TAG_START_RE = re.compile(r"<(/?)([A-Za-z][A-Za-z0-9-]*)(?=[\s/>]|$)")
+_HTML_TAG_LINE_RE = re.compile(rf"(?:{_HTML_TAG})[ \t]*")
+_HTML_RAW_TAGS = frozenset(("pre", "script", "style", "textarea"))
+_HTML_BLOCK_TAGS = frozenset((
+    "address", "article", "aside", "base", "basefont", "blockquote", "body",
+    "caption", "center", "col", "colgroup", "dd", "details", "dialog", "dir",
+    "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form",
+    "frame", "frameset", "h1", "h2", "h3", "h4", "h5", "h6", "head", "header",
+    "hr", "html", "iframe", "legend", "li", "link", "main", "menu", "menuitem",
+    "nav", "noframes", "ol", "optgroup", "option", "p", "param", "search",
+    "section", "summary", "table", "tbody", "td", "tfoot", "th", "thead",
+    "title", "tr", "track", "ul",
+))
+_BACKSLASH_ESCAPE_RE = re.compile(r"\\([!-/:-@\[-`{-~])")
+
+# Escaped or entity-decoded * and _ are literal, so they are swapped for
+# private-use stand-ins until emphasis has been stripped
+_PROTECT_MARKERS = str.maketrans({"*": "\ue000", "_": "\ue001"})
+_RESTORE_MARKERS = str.maketrans({"\ue000": "*", "\ue001": "_"})
+
+_STAR_EMPHASIS_RE = re.compile(r"(\*\*|\*)(?=\S)(.+?)(?<=\S)\1", re.DOTALL)
+# CommonMark flanking rule: underscores inside a word (snake_case_name) neither
+# open nor close emphasis
+_UNDERSCORE_EMPHASIS_RE = re.compile(
+    r"(?<!\w)(__|_)(?=\S)(.+?)(?<=\S)\1(?!\w)", re.DOTALL
+)
+
+
+@dataclass(slots=True)
 class SlideData:
     """Represents data for a single slide"""
     title: str
-    body_text: str = ""
+    body_parts: List[str] = field(default_factory=list)
     image_url: Optional[str] = None
     layout: str = "BLANK"
 
+    @property
+    def body_text(self) -> str:
+        """Body text, joined from the collected parts"""
+        return "\n".join(self.body_parts)
+
     def has_content(self) -> bool:
         """Check if slide has any content"""
-        return bool(self.title or self.body_text or self.image_url)
+        return bool(self.title or self.body_parts or self.image_url)
 
 
 class MarkdownToSlidesParser:
     """Parser for converting Markdown to slide structure"""
 
     def __init__(self):
-        self.md = MarkdownIt()
         self.slides: List[SlideData] = []
         self.current_slide: Optional[SlideData] = None
         self.presentation_title: Optional[str] = None
         self.warnings: List[str] = []
 
+        # Line-scanner state for the block currently being collected
+        self._paragraph: List[str] = []
+        self._list_items: List[List[str]] = []
+        self._list_marker: Optional[str] = None
+        self._list_gap = False
+        self._fence: Optional[str] = None
+        self._fence_in_list = False
+        self._code_lines: List[str] = []
+        # Text that ends the open HTML block; "" means the next blank line
+        self._html_end: Optional[str] = None
+
+        # Link reference definitions by normalized label
+        self._references: Dict[str, str] = {}
+
     def parse(self, markdown_content: str) -> Dict[str, Any]:
         """
         Parse markdown content into slide structure
@@ -46,62 +152,229 @@ class MarkdownToSlidesParser:
         Returns:
             Dict with presentation_title, slides, and warnings
         """
-        tokens = self.md.parse(markdown_content)
-        self._process_tokens(tokens)
+        for _ in self.iter_slides(markdown_content):
+            pass
+        return self._result()
+
+    def iter_slides(self, markdown_content: str) -> Iterator[SlideData]:
+        """
+        Yield each slide as soon as it is complete
+
+        A slide is complete when the next H2 starts or the input ends. The
+        presentation title and warnings are available on the parser once the
+        iterator is exhausted.
+
+        Args:
+            markdown_content: Markdown text content
+
+        Yields:
+            SlideData for each slide, in document order
+        """
+        # References may be defined after they are used, so collect them up front
+        if "]:" in markdown_content:
+            for definition in _REFERENCE_DEFINITION_RE.finditer(markdown_content):
+                self._add_reference(definition)
+
+        emitted = 0
+        for line in markdown_content.splitlines():
+            self._process_line(line)
+            if len(self.slides) > emitted:
+                yield from self.slides[emitted:]
+                emitted = len(self.slides)
+
+        self._finish()
+        yield from self.slides[emitted:]
+
+    def _finish(self) -> Dict[str, Any]:
+        """Close any open block and emit the parse result"""
+        self._close_blocks()
 
         # Finalize last slide
         if self.current_slide and self.current_slide.has_content():
             self.slides.append(self.current_slide)
+        self.current_slide = None
+
+        return self._result()
 
+    def _result(self) -> Dict[str, Any]:
+        """Build the parse result"""
         return {
             "presentation_title": self.presentation_title,
             "slides": self.slides,
             "warnings": self.warnings
         }
 
-    def _process_tokens(self, tokens: List[Token]):
-        """Process markdown tokens into slides"""
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
-
-            if token.type == "heading_open":
-                i = self._process_heading(tokens, i)
-            elif token.type == "paragraph_open":
-                i = self._process_paragraph(tokens, i)
-            elif token.type == "bullet_list_open":
-                i = self._process_list(tokens, i, ordered=False)
-            elif token.type == "ordered_list_open":
-                i = self._process_list(tokens, i, ordered=True)
-            elif token.type == "fence":
-                self._process_code_block(token)
-                i += 1
-            elif token.type == "image":
-                self._process_image(token)
-                i += 1
+    def _process_line(self, line: str):
+        """Advance the scanner by one source line"""
+        if self._fence is not None:
+            # Inside a fenced code block everything is literal until the closing fence
+            stripped = line.strip()
+            if stripped.startswith(self._fence) and not stripped.strip(self._fence[0]):
+                self._close_code_block()
             else:
-                i += 1
+                self._code_lines.append(line)
+            return
 
-        return i
+        if self._html_end is not None:
+            # Inside an HTML block nothing is rendered until its end marker
+            end = self._html_end
+            if (end and end in line.lower()) or (not end and not line.strip()):
+                self._html_end = None
+            return
 
-    def _process_heading(self, tokens: List[Token], start_idx: int) -> int:
-        """Process heading token"""
-        heading_open = tokens[start_idx]
-        level = int(heading_open.tag[1])  # h1 -> 1, h2 -> 2
+        stripped = line.strip()
+        if not stripped:
+            # Blank line ends a paragraph; a list stays open until non-item text follows
+            self._close_paragraph()
+            if self._list_marker is not None:
+                self._list_gap = True
+            return
+
+        if (
+            line[0] in " \t"
+            and not self._paragraph
+            and self._list_marker is None
+            and len(line[:len(line) - len(line.lstrip())].expandtabs(4)) >= 4
+        ):
+            # Indented code block; these were never rendered onto slides
+            return
 
-        # Find content
-        content = ""
-        idx = start_idx + 1
-        while idx < len(tokens) and tokens[idx].type != "heading_close":
-            if tokens[idx].type == "inline":
-                content = tokens[idx].content
-            idx += 1
+        first = stripped[0]
 
+        if first not in _BLOCK_START_CHARS:
+            # Plain text, the common case: no block construct can start here
+            self._add_text_line(line, stripped)
+            return
+
+        if first == ">":
+            # Blockquotes are flattened into the surrounding content
+            self._process_line(stripped.lstrip(">").lstrip())
+            return
+
+        if first == "#":
+            heading = _HEADING_RE.match(stripped)
+            if heading:
+                self._close_blocks()
+                self._process_heading(len(heading.group(1)), heading.group(2) or "")
+                return
+
+        if first in "`~" and stripped[:3] in ("```", "~~~"):
+            if self._list_marker is not None and line[0] in " \t":
+                # Fenced code inside a list item; items only keep their text
+                self._fence_in_list = True
+            else:
+                self._close_blocks()
+            marker = stripped[0] * (len(stripped) - len(stripped.lstrip(stripped[0])))
+            self._fence = marker
+            return
+
+        if first == "<":
+            end = self._html_block_end(stripped)
+            if end is not None:
+                self._close_blocks()
+                # A block can end on its own opening line, e.g. <!-- note -->
+                if not end or end not in stripped[1:].lower():
+                    self._html_end = end
+                return
+
+        if first == "[" and not self._paragraph and self._list_marker is None:
+            definition = _REFERENCE_DEFINITION_RE.match(line)
+            if definition:
+                self._add_reference(definition)
+                return
+
+        if self._paragraph and first in "=-" and _SETEXT_UNDERLINE_RE.match(stripped):
+            # Setext heading: the pending paragraph becomes an H1 (===) or H2 (---)
+            content = "\n".join(self._paragraph)
+            self._paragraph = []
+            self._close_blocks()
+            self._process_heading(1 if first == "=" else 2, content)
+            return
+
+        if first in "*-_" and _THEMATIC_BREAK_RE.match(stripped):
+            self._close_blocks()
+            return
+
+        if first in "-*+" and (len(stripped) == 1 or stripped[1] in " \t"):
+            self._add_list_item(first, stripped[1:].strip())
+            return
+
+        if first.isdigit():
+            ordered = _ORDERED_ITEM_RE.match(stripped)
+            if ordered:
+                self._add_list_item(ordered.group(2), stripped[ordered.end():].strip())
+                return
+
+        self._add_text_line(line, stripped)
+
+    def _html_block_end(self, stripped: str) -> Optional[str]:
+        """Return the end marker if the line opens an HTML block, else None"""
+        lower = stripped.lower()
+        if lower.startswith("<!--"):
+            return "-->"
+        if lower.startswith("<?"):
+            return "?>"
+        if lower.startswith("<![cdata["):
+            return "]]>"
+        if lower.startswith("<!") and lower[2:3].isalpha():
+            return ">"
+        tag = _HTML_TAG_START_RE.match(stripped)
+        if tag is None:
+            return None
+        name = tag.group(2).lower()
+        if not tag.group(1) and name in _HTML_RAW_TAGS:
+            return f"</{name}>"
+        if name in _HTML_BLOCK_TAGS:
+            return ""
+        # Any other tag only opens a block when alone on its line, outside a paragraph
+        if not self._paragraph and _HTML_TAG_LINE_RE.fullmatch(stripped):
+            return ""
+        return None
+
+    def _add_reference(self, definition: "re.Match[str]"):
+        """Record a link reference definition; the first one for a label wins"""
+        label = " ".join(definition.group("label").split()).casefold()
+        if label:
+            self._references.setdefault(label, _link_destination(definition.group("destination")))
+
+    def _reference(self, label: str) -> Optional[str]:
+        """Look up a link reference by label"""
+        return self._references.get(" ".join(label.split()).casefold())
+
+    def _add_text_line(self, line: str, stripped: str):
+        """Add a plain text line to the open list item or paragraph"""
+        if self._list_marker is not None:
+            if not self._list_gap or line[0] in " \t":
+                # Continuation text belongs to the last list item
+                self._list_items[-1].append(stripped)
+                return
+            self._close_list()
+
+        self._paragraph.append(stripped)
+
+    def _add_list_item(self, marker: str, content: str):
+        """Start a list item, opening a new list when the marker style changes"""
+        self._close_paragraph()
+        if self._list_marker != marker:
+            self._close_list()
+            self._list_marker = marker
+        self._list_gap = False
+        self._list_items.append([content])
+
+    def _close_blocks(self):
+        """Flush any open paragraph, list or code block"""
+        self._close_paragraph()
+        self._close_list()
+        if self._fence is not None:
+            self._close_code_block()
+
+    def _process_heading(self, level: int, content: str):
+        """Process heading line"""
         if level == 1:
             # H1 = Presentation title
             if not self.presentation_title:
                 self.presentation_title = content
-                logger.info(f"Found presentation title: {content}")
+                logger.info("Found presentation title: %s", content)
             else:
                 self.warnings.append(f"Multiple H1 headings found, ignoring: {content}")
 
@@ -111,7 +384,7 @@ class MarkdownToSlidesParser:
                 self.slides.append(self.current_slide)
 
             self.current_slide = SlideData(title=content)
-            logger.info(f"New slide: {content}")
+            logger.info("New slide: %s", content)
 
         elif level == 3:
             # H3 = Subheading in body (bold)
@@ -126,99 +399,122 @@ class MarkdownToSlidesParser:
             if self.current_slide:
                 self._append_to_body(f"\n{content}\n")
 
-        return idx + 1
+    def _close_paragraph(self):
+        """Process the collected paragraph lines"""
+        if not self._paragraph:
+            return
+        content = self._process_inline("\n".join(self._paragraph))
+        self._paragraph = []
 
-    def _process_paragraph(self, tokens: List[Token], start_idx: int) -> int:
-        """Process paragraph token"""
-        idx = start_idx + 1
-        content = ""
+        # A paragraph made only of images leaves nothing but line breaks behind
+        if content and not content.isspace() and self.current_slide:
+            self._append_to_body(content + "\n")
 
-        while idx < len(tokens) and tokens[idx].type != "paragraph_close":
-            if tokens[idx].type == "inline":
-                content = self._process_inline(tokens[idx])
-            idx += 1
+    def _process_inline(self, text: str) -> str:
+        """Pull images out of paragraph text, drop link/emphasis markup and resolve escapes"""
+        parts: List[str] = []
+        run: List[str] = []
+        self._scan_inline(text, parts, run)
+        parts.append(self._strip_emphasis("".join(run)))
+        return "".join(parts).translate(_RESTORE_MARKERS)
 
-        if content and self.current_slide:
-            self._append_to_body(content + "\n")
+    def _scan_inline(self, text: str, parts: List[str], run: List[str]):
+        """
+        Tokenize inline text into the current plain text run
 
-        return idx + 1
-
-    def _process_inline(self, token: Token) -> str:
-        """Process inline content (text with formatting)"""
-        content = token.content
-
-        # Process children for images and formatting
-        if token.children:
-            parts = []
-            for child in token.children:
-                if child.type == "image":
-                    self._process_image(child)
-                    # Don't include image markdown in text
-                    continue
-                elif child.type == "text":
-                    parts.append(child.content)
-                elif child.type == "code_inline":
-                    parts.append(f"`{child.content}`")
+        Code spans close the run, since they are kept verbatim and emphasis is
+        only stripped from the text between them. Link text is scanned into
+        the same run, so emphasis around a link is still stripped.
+        """
+        pos = 0
+        while pos < len(text):
+            match = _INLINE_RE.match(text, pos)
+            kind = match.lastgroup
+            pos = match.end()
+            if kind == "text":
+                run.append(match.group())
+            elif kind == "escape":
+                run.append(match.group("escaped").translate(_PROTECT_MARKERS))
+            elif kind == "entity":
+                run.append(html.unescape(match.group()).translate(_PROTECT_MARKERS))
+            elif kind == "link":
+                self._scan_inline(match.group("link_text"), parts, run)
+            elif kind == "ref_link":
+                label = match.group("ref_link_label") or match.group("ref_link_text")
+                if self._reference(label) is not None:
+                    self._scan_inline(match.group("ref_link_text"), parts, run)
+                else:
+                    # Undefined reference: the bracket is literal text
+                    run.append("[")
+                    pos = match.start() + 1
+            elif kind == "autolink":
+                run.append(match.group("autolink_url").translate(_PROTECT_MARKERS))
+            elif kind == "html":
+                continue
+            elif kind == "code":
+                parts.append(self._strip_emphasis("".join(run)))
+                parts.append(f"`{match.group('code_text')}`")
+                run.clear()
+            elif kind == "image":
+                self._process_image(_link_destination(match.group("image_url")))
+            else:
+                image_url = self._reference(match.group("ref_image_label") or match.group("ref_image_alt"))
+                if image_url is not None:
+                    self._process_image(image_url)
                 else:
-                    parts.append(child.content)
-            content = "".join(parts)
-
-        return content
-
-    def _process_list(self, tokens: List[Token], start_idx: int, ordered: bool) -> int:
-        """Process bullet or ordered list"""
-        idx = start_idx + 1
-        list_items = []
-        item_number = 1
-
-        while idx < len(tokens):
-            token = tokens[idx]
-
-            if token.type in ("bullet_list_close", "ordered_list_close"):
-                break
-
-            if token.type == "list_item_open":
-                # Get item content
-                idx += 1
-                item_content = ""
-                while idx < len(tokens) and tokens[idx].type != "list_item_close":
-                    if tokens[idx].type == "inline":
-                        item_content = tokens[idx].content
-                    elif tokens[idx].type == "paragraph_open":
-                        idx += 1
-                        if tokens[idx].type == "inline":
-                            item_content = tokens[idx].content
-                    idx += 1
-
-                if item_content:
-                    if ordered:
-                        list_items.append(f"{item_number}. {item_content}")
-                        item_number += 1
-                    else:
-                        list_items.append(f"• {item_content}")
-
-            idx += 1
-
-        if list_items and self.current_slide:
-            self._append_to_body("\n".join(list_items) + "\n")
-
-        return idx + 1
-
-    def _process_code_block(self, token: Token):
+                    run.append("!")
+                    pos = match.start() + 1
+
+    @staticmethod
+    def _strip_emphasis(text: str) -> str:
+        """Remove emphasis markers, innermost pairs last"""
+        if "*" in text or "_" in text:
+            previous = None
+            while previous != text:
+                previous = text
+                text = _STAR_EMPHASIS_RE.sub(r"\2", text)
+                text = _UNDERSCORE_EMPHASIS_RE.sub(r"\2", text)
+        return text
+
+    def _close_list(self):
+        """Process the collected bullet or ordered list"""
+        marker = self._list_marker
+        if marker is None:
+            return
+        # Empty items are dropped and don't take a number
+        items = [item for item in map("\n".join, self._list_items) if item]
+        self._list_items = []
+        self._list_marker = None
+        self._list_gap = False
+
+        if not items or not self.current_slide:
+            return
+
+        if marker in ".)":
+            body = "\n".join(f"{number}. {item}" for number, item in enumerate(items, 1))
+        else:
+            body = "\n".join(f"• {item}" for item in items)
+        self._append_to_body(body + "\n")
+
+    def _close_code_block(self):
         """Process code block as monospace text"""
+        lines = self._code_lines
+        self._code_lines = []
+        self._fence = None
+        if self._fence_in_list:
+            self._fence_in_list = False
+            return
         if self.current_slide:
-            code = token.content.strip()
+            code = "\n".join(lines).strip()
             # Add code with clear boundaries
             self._append_to_body(f"\n```\n{code}\n```\n")
 
-    def _process_image(self, token: Token):
+    def _process_image(self, image_url: str):
         """Process image - only first image per slide"""
         if not self.current_slide:
-            self.warnings.append(f"Image found before any slide: {token.attrGet('src')}")
+            self.warnings.append(f"Image found before any slide: {image_url}")
             return
 
-        image_url = token.attrGet("src")
-
         if self.current_slide.image_url:
             # Already has an image
             self.warnings.append(
@@ -227,15 +523,89 @@ class MarkdownToSlidesParser:
             )
         else:
             self.current_slide.image_url = image_url
-            logger.info(f"Added image to slide '{self.current_slide.title}': {image_url}")
+            logger.info("Added image to slide '%s': %s", self.current_slide.title, image_url)
 
     def _append_to_body(self, text: str):
         """Append text to current slide body"""
         if self.current_slide:
-            if self.current_slide.body_text:
-                self.current_slide.body_text += "\n" + text
-            else:
-                self.current_slide.body_text = text
+            self.current_slide.body_parts.append(text)
+
+
+def _link_destination(destination: str) -> str:
+    """Unwrap, unescape and percent-encode a link or image destination, as markdown-it does"""
+    if destination.startswith("<"):
+        destination = destination[1:-1]
+    destination = html.unescape(_BACKSLASH_ESCAPE_RE.sub(r"\1", destination))
+    return quote(destination, safe="%;/?:@&=+$,-_.!~*'()#")
+
+
+class IncrementalSlidesParser:
+    """
+    Parser for Markdown that arrives in chunks (e.g. streamed LLM output)
+
+    Each complete line is fed to the line scanner exactly once, so total work
+    is linear in the document size instead of re-parsing the whole buffer on
+    every chunk. Slides become stable as soon as the next H2 starts.
+    """
+
+    def __init__(self):
+        self._parser = MarkdownToSlidesParser()
+        self._partial_line: List[str] = []
+
+    @property
+    def presentation_title(self) -> Optional[str]:
+        """Presentation title seen so far"""
+        return self._parser.presentation_title
+
+    @property
+    def committed_slides(self) -> List[SlideData]:
+        """Slides that are complete and will not change with more input"""
+        return list(self._parser.slides)
+
+    def append(self, chunk: str) -> None:
+        """
+        Feed the next chunk of markdown
+
+        Args:
+            chunk: Markdown text, may end in the middle of a line
+        """
+        if "\n" not in chunk:
+            if chunk:
+                self._partial_line.append(chunk)
+            return
+
+        self._partial_line.append(chunk)
+        lines = "".join(self._partial_line).split("\n")
+        tail = lines.pop()
+        self._partial_line = [tail] if tail else []
+
+        for line in lines:
+            self._parser._process_line(line.rstrip("\r"))
+
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Parse any buffered input and return the full result
+
+        Returns:
+            Same structure as parse_markdown_to_slides
+        """
+        if self._partial_line:
+            self._parser._process_line("".join(self._partial_line).rstrip("\r"))
+            self._partial_line = []
+        return self._parser._finish()
+
+
+def iter_slides(markdown_content: str) -> Iterator[SlideData]:
+    """
+    Parse markdown content lazily, yielding each slide once it is complete
+
+    Args:
+        markdown_content: Markdown text content
+
+    Returns:
+        Iterator of SlideData in document order
+    """
+    return MarkdownToSlidesParser().iter_slides(markdown_content)
 
 
 def parse_markdown_to_slides(markdown_content: str) -> Dict[str, Any]:
@@ -253,3 +623,57 @@ def parse_markdown_to_slides(markdown_content: str) -> Dict[str, Any]:
     """
     parser = MarkdownToSlidesParser()
     return parser.parse(markdown_content)
+
+
+def _copy_parse_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "presentation_title": result["presentation_title"],
+        "slides": list(result["slides"]),
+        "warnings": list(result["warnings"])
+    }
+
+
+def get_cached_markdown_parse(markdown_content: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached parse of markdown content without parsing on a miss
+
+    Lets async callers serve repeats directly and only hand misses to a
+    worker thread.
+
+    Args:
+        markdown_content: Markdown text content
+
+    Returns:
+        Same as parse_markdown_to_slides_cached, or None if not cached
+    """
+    with _parse_cache_lock:
+        result = _parse_cache.get(markdown_content)
+        if result is not None:
+            _parse_cache.move_to_end(markdown_content)
+    return _copy_parse_result(result) if result is not None else None
+
+
+def parse_markdown_to_slides_cached(markdown_content: str) -> Dict[str, Any]:
+    """
+    Parse markdown content into slide structure, reusing recent results
+
+    Retries and re-submissions of the same document skip parsing. The
+    returned dict and lists are fresh, but the SlideData objects are shared
+    with the cache and must not be modified. Safe to call from worker threads.
+
+    Args:
+        markdown_content: Markdown text content
+
+    Returns:
+        Same as parse_markdown_to_slides
+    """
+    cached = get_cached_markdown_parse(markdown_content)
+    if cached is not None:
+        return cached
+
+    result = parse_markdown_to_slides(markdown_content)
+    with _parse_cache_lock:
+        _parse_cache[markdown_content] = result
+        while len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return _copy_parse_result(result)
@@ -0,0 +1,378 @@
+"""
+Async Google Slides REST Client
+
+Calls the Slides REST API over a shared httpx.AsyncClient, so tools await the
+network directly instead of parking a worker thread on each googleapiclient
+request. Responses are decoded with orjson, which matters for full
+presentations().get payloads on large decks. The client speaks HTTP/2 when h2
+is installed, and each user's concurrent calls back off when Slides throttles
+them. The discovery-built service is only used for its credentials.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import contextvars
+import functools
+import hashlib
+import importlib.util
+import json
+import logging
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
+
+import httplib2
+import httpx
+import orjson
+from google_auth_httplib2 import Request
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+SLIDES_API_URL = "https://slides.googleapis.com/v1"
+
+# HTTP/2 lets concurrent calls share one connection. h2 comes with the httpx[http2]
+# dependency, but fall back to HTTP/1.1 where it was installed without the extra
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Calls one user may have in flight while Slides isn't pushing back
+_MAX_CALLS_IN_FLIGHT = 32
+_LIMITERS_SIZE = 256
+
+# Longest Retry-After pause honoured, in seconds
+_MAX_RETRY_AFTER = 60.0
+
+# Blocking Slides work (token refreshes, markdown parsing) runs here instead of the
+# loop's default executor, so a stalled Slides call can't hold threads other tools need
+_SLIDES_WORKERS = 16
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=_SLIDES_WORKERS, thread_name_prefix='slides'
+)
+
+# One connection pool per event loop; httpx clients can't be shared across loops.
+# Keyed weakly, so a loop's client and its pooled connections go with the loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client for the running event loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        # Clients of loops that were closed but are still referenced can't be reused
+        for stale in [other for other in _clients if other.is_closed()]:
+            del _clients[stale]
+        client = _clients[loop] = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=75
+            )
+        )
+    return client
+
+
+class _AdaptiveLimiter:
+    """
+    AIMD limit on one user's concurrent Slides calls.
+
+    A 429 or 503 halves the number of calls allowed in flight and, if the
+    response says when to retry, holds new calls until then. Each successful
+    call adds half a slot back, up to _MAX_CALLS_IN_FLIGHT. Calls that fail
+    for other reasons leave the limit alone.
+    """
+
+    def __init__(self, max_limit: int = _MAX_CALLS_IN_FLIGHT):
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._resume_at = 0.0
+        self._waiters: collections.deque = collections.deque()
+
+    async def acquire(self) -> None:
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Woken but leaving; pass the free slot on
+                    self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def release(self, throttled: Optional[bool], retry_after: Optional[float] = None) -> None:
+        self.in_flight -= 1
+        if throttled:
+            self.limit = max(1.0, self.limit / 2)
+            if retry_after:
+                self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+            logger.warning("Slides API throttled; allowing %s concurrent calls", int(self.limit))
+        elif throttled is False:
+            self.limit = min(float(self.max_limit), self.limit + 0.5)
+        self._wake()
+
+    def _wake(self) -> None:
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    @property
+    def idle(self) -> bool:
+        return self.in_flight == 0 and not self._waiters
+
+
+# {credentials_owner: limiter}; quotas are per user, so one user's throttling doesn't slow others
+_limiters: Dict[str, _AdaptiveLimiter] = {}
+
+# Owner-less credentials can't be matched to a user, so each credentials object gets its own
+_anonymous_limiters: "weakref.WeakKeyDictionary[Any, _AdaptiveLimiter]" = weakref.WeakKeyDictionary()
+
+# Token refreshes in flight, so concurrent calls with expired credentials share one
+_refreshes: Dict[Any, asyncio.Future] = {}
+
+
+def service_credentials(service) -> Any:
+    """
+    Return the OAuth credentials a discovery-built service was authorized with.
+
+    Raises:
+        TypeError: If the service wasn't built over google_auth_httplib2.AuthorizedHttp
+    """
+    credentials = getattr(getattr(service, '_http', None), 'credentials', None)
+    if credentials is None:
+        raise TypeError(
+            "Slides calls need a service built over google_auth_httplib2.AuthorizedHttp, "
+            f"got {type(service).__name__} without credentials"
+        )
+    return credentials
+
+
+@functools.lru_cache(maxsize=_LIMITERS_SIZE)
+def _fingerprint(client_id: Optional[str], refresh_token: str) -> str:
+    return hashlib.sha256(f"{client_id}:{refresh_token}".encode()).hexdigest()
+
+
+def credentials_owner(credentials) -> Optional[str]:
+    """
+    Identify the user behind credentials, stable across token refreshes.
+
+    Uses the same client_id:refresh_token fingerprint as the service cache in
+    auth.service_decorator. Returns None for credentials without a refresh
+    token, which can't be told apart from anyone else's.
+    """
+    refresh_token = getattr(credentials, 'refresh_token', None)
+    if not refresh_token:
+        return None
+    return _fingerprint(getattr(credentials, 'client_id', None), refresh_token)
+
+
+def _get_limiter(credentials) -> _AdaptiveLimiter:
+    owner = credentials_owner(credentials)
+    if owner is None:
+        try:
+            return _anonymous_limiters.setdefault(credentials, _AdaptiveLimiter())
+        except TypeError:
+            # Not weakly referenceable, so there's nothing to key on: don't share
+            return _AdaptiveLimiter()
+
+    limiter = _limiters.get(owner)
+    if limiter is None:
+        if len(_limiters) >= _LIMITERS_SIZE:
+            for key in [key for key, entry in _limiters.items() if entry.idle]:
+                del _limiters[key]
+        limiter = _limiters[owner] = _AdaptiveLimiter()
+    return limiter
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, if it gives a number."""
+    try:
+        seconds = float(response.headers.get('Retry-After', ''))
+    except ValueError:
+        return None
+    return min(seconds, _MAX_RETRY_AFTER) if seconds > 0 else None
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Like asyncio.to_thread, but on the Slides thread pool."""
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _executor, context.run, func, *args
+    )
+
+
+def _dumps(body: Any) -> bytes:
+    try:
+        return orjson.dumps(body)
+    except TypeError:
+        # orjson rejects a few values the stdlib accepts, e.g. ints beyond 64 bits
+        return json.dumps(body).encode('utf-8')
+
+
+async def _refresh(credentials) -> None:
+    """Refresh expired credentials, sharing one refresh between concurrent callers."""
+    refresh = _refreshes.get(credentials)
+    if refresh is None:
+        refresh = asyncio.ensure_future(run_blocking(credentials.refresh, Request(httplib2.Http())))
+        _refreshes[credentials] = refresh
+        refresh.add_done_callback(lambda _: _refreshes.pop(credentials, None))
+    # Shielded so one caller giving up doesn't cancel the refresh for the others
+    await asyncio.shield(refresh)
+
+
+async def _auth_headers(credentials) -> Dict[str, str]:
+    """Build the Authorization header from the credentials, refreshing them if expired."""
+    if not credentials.valid:
+        await _refresh(credentials)
+
+    headers: Dict[str, str] = {}
+    credentials.apply(headers)
+    return headers
+
+
+async def slides_request(
+    service,
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Send one request to the Slides REST API.
+
+    Args:
+        service: The Google Slides service instance (source of credentials)
+        method: HTTP method
+        path: Path below /v1, e.g. 'presentations/{id}:batchUpdate'
+        params: Optional query parameters
+        body: Optional JSON request body
+
+    Returns:
+        The decoded JSON response
+
+    Raises:
+        HttpError: If the API returns an error status, same as googleapiclient
+    """
+    url = f"{SLIDES_API_URL}/{path}"
+    credentials = service_credentials(service)
+    headers = await _auth_headers(credentials)
+
+    content = None
+    if body is not None:
+        headers['Content-Type'] = 'application/json'
+        content = _dumps(body)
+
+    limiter = _get_limiter(credentials)
+    await limiter.acquire()
+    throttled = None
+    retry_after = None
+    try:
+        response = await _get_client().request(
+            method, url, params=params, content=content, headers=headers
+        )
+        throttled = response.status_code in (429, 503)
+        if throttled:
+            retry_after = _retry_after(response)
+    finally:
+        limiter.release(throttled, retry_after)
+
+    if response.status_code >= 300:
+        raise HttpError(
+            httplib2.Response({'status': response.status_code}),
+            response.content,
+            uri=str(response.url)
+        )
+
+    return orjson.loads(response.content) if response.content else {}
+
+
+async def create_presentation(service, body: Dict[str, Any]) -> Dict[str, Any]:
+    """POST presentations"""
+    return await slides_request(service, 'POST', 'presentations', body=body)
+
+
+async def get_presentation(
+    service,
+    presentation_id: str,
+    fields: Optional[str] = None
+) -> Dict[str, Any]:
+    """GET presentations/{presentationId}, optionally limited to a field mask"""
+    params = {'fields': fields} if fields else None
+    return await slides_request(
+        service, 'GET', f"presentations/{quote(presentation_id, safe='')}", params=params
+    )
+
+
+async def batch_update(
+    service,
+    presentation_id: str,
+    requests: List[Dict[str, Any]],
+    required_revision_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """POST presentations/{presentationId}:batchUpdate, optionally only if still at a given revision"""
+    body: Dict[str, Any] = {'requests': requests}
+    if required_revision_id:
+        body['writeControl'] = {'requiredRevisionId': required_revision_id}
+    return await slides_request(
+        service,
+        'POST',
+        f"presentations/{quote(presentation_id, safe='')}:batchUpdate",
+        body=body
+    )
+
+
+async def get_page(
+    service,
+    presentation_id: str,
+    page_object_id: str,
+    fields: Optional[str] = None
+) -> Dict[str, Any]:
+    """GET presentations/{presentationId}/pages/{pageObjectId}"""
+    params = {'fields': fields} if fields else None
+    return await slides_request(
+        service,
+        'GET',
+        f"presentations/{quote(presentation_id, safe='')}/pages/{quote(page_object_id, safe='')}",
+        params=params
+    )
+
+
+async def get_page_thumbnail(
+    service,
+    presentation_id: str,
+    page_object_id: str,
+    thumbnail_size: str
+) -> Dict[str, Any]:
+    """GET presentations/{presentationId}/pages/{pageObjectId}/thumbnail"""
+    return await slides_request(
+        service,
+        'GET',
+        f"presentations/{quote(presentation_id, safe='')}/pages/{quote(page_object_id, safe='')}/thumbnail",
+        params={'thumbnailProperties.thumbnailSize': thumbnail_size}
+    )
+
+
+async def head(url: str, timeout: float) -> httpx.Response:
+    """HEAD an arbitrary URL over the shared client, without following redirects."""
+    return await _get_client().head(url, follow_redirects=False, timeout=timeout)
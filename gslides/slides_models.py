@@ -4,8 +4,30 @@ Google Slides Response Models
 Pydantic models for Google Slides API responses.
 """
 
+from typing import Any, Optional, Union
+
 from pydantic import BaseModel, Field
 
+__all__ = [
+    "CreatePresentationResponse",
+    "GetPresentationResponse",
+    "BatchUpdateResponse",
+    "GetPageResponse",
+    "GetPagesResponse",
+    "ThumbnailResponse",
+    "ThumbnailsResponse",
+    "AddSlideResponse",
+    "AddTitleResponse",
+    "AddBodyTextResponse",
+    "AddBodyImageResponse",
+    "AddPageWithContentResponse",
+    "AddSlideContentResponse",
+    "AddManyResponse",
+    "BulkApplyResponse",
+    "MarkdownToSlidesResponse",
+    "ErrorResponse",
+]
+
 
 class CreatePresentationResponse(BaseModel):
     """Response from create_presentation"""
@@ -16,6 +38,163 @@ class CreatePresentationResponse(BaseModel):
     slides_created: int = Field(description="Number of slides created initially")
 
 
+class GetPresentationResponse(BaseModel):
+    """Response from get_presentation; str() renders the human-readable summary"""
+    success: bool = Field(description="Whether the operation succeeded")
+    presentation_id: str = Field(description="The ID of the presentation")
+    presentation_url: str = Field(description="The URL to access the presentation")
+    title: str = Field(description="The title of the presentation")
+    revision_id: Optional[str] = Field(default=None, description="The presentation's current revision ID")
+    slide_count: int = Field(description="Number of slides in the presentation")
+    page_width: Optional[Union[int, float]] = Field(default=None, description="Page width, in page_size_unit")
+    page_height: Optional[Union[int, float]] = Field(default=None, description="Page height, in page_size_unit")
+    page_size_unit: str = Field(default="", description="Unit of the page dimensions, e.g. EMU")
+    slides: Optional[list[dict[str, Any]]] = Field(
+        default=None,
+        description="Each slide's ID and element count, in order; only set with verbose=True"
+    )
+
+    def __str__(self) -> str:
+        width = 'Unknown' if self.page_width is None else self.page_width
+        height = 'Unknown' if self.page_height is None else self.page_height
+        text = f"""Presentation Details:
+- Title: {self.title}
+- Presentation ID: {self.presentation_id}
+- URL: {self.presentation_url}
+- Revision ID: {self.revision_id or 'Unknown'}
+- Total Slides: {self.slide_count}
+- Page Size: {width} x {height} {self.page_size_unit}"""
+        if self.slides is not None:
+            slides_info = "\n".join(
+                f"  Slide {i}: ID {slide['slide_id']}, {slide['element_count']} element(s)"
+                for i, slide in enumerate(self.slides, 1)
+            )
+            text += f"\n\nSlides Breakdown:\n{slides_info or '  No slides found'}"
+        return text
+
+
+class BatchUpdateResponse(BaseModel):
+    """Response from batch_update_presentation; str() renders the human-readable summary"""
+    success: bool = Field(description="Whether the operation succeeded")
+    presentation_id: str = Field(description="The ID of the presentation")
+    presentation_url: str = Field(description="The URL to access the presentation")
+    requests_applied: int = Field(description="Number of requests sent in the batch")
+    revision_id: Optional[str] = Field(default=None, description="The presentation's revision ID after the update")
+    results: list[str] = Field(
+        description="Outcome of each request, in request order",
+        default_factory=list
+    )
+
+    def __str__(self) -> str:
+        text = f"""Batch Update Completed:
+- Presentation ID: {self.presentation_id}
+- URL: {self.presentation_url}
+- Requests Applied: {self.requests_applied}
+- Replies Received: {len(self.results)}
+- Revision ID: {self.revision_id or 'Unknown'}"""
+        if self.results:
+            text += "\n\nUpdate Results:\n" + "\n".join(
+                f"  Request {i}: {result}" for i, result in enumerate(self.results, 1)
+            )
+        return text
+
+
+def _element_line(element: dict[str, str]) -> str:
+    return f"  {element['kind']}: ID {element['object_id']}, {element['detail']}"
+
+
+class GetPageResponse(BaseModel):
+    """Response from get_page; str() renders the human-readable summary"""
+    success: bool = Field(description="Whether the operation succeeded")
+    presentation_id: str = Field(description="The ID of the presentation")
+    page_id: str = Field(description="The object ID of the page")
+    page_type: str = Field(description="The page type, e.g. SLIDE")
+    element_count: int = Field(description="Number of elements on the page")
+    elements: Optional[list[dict[str, str]]] = Field(
+        default=None,
+        description="Each element's object_id, kind and detail; only set with verbose=True"
+    )
+
+    def __str__(self) -> str:
+        text = f"""Page Details:
+- Presentation ID: {self.presentation_id}
+- Page ID: {self.page_id}
+- Page Type: {self.page_type}
+- Total Elements: {self.element_count}"""
+        if self.elements is not None:
+            elements_info = "\n".join(map(_element_line, self.elements))
+            text += f"\n\nPage Elements:\n{elements_info or '  No elements found'}"
+        return text
+
+
+class GetPagesResponse(BaseModel):
+    """Response from get_pages; str() renders the human-readable summary"""
+    success: bool = Field(description="Whether every page was retrieved")
+    presentation_id: str = Field(description="The ID of the presentation")
+    page_ids: list[str] = Field(description="The requested page IDs, in the order given")
+    pages: list[Union[GetPageResponse, "ErrorResponse"]] = Field(
+        description="Each requested page, or the error fetching it, in the order of page_ids"
+    )
+
+    def __str__(self) -> str:
+        sections = []
+        for page_id, page in zip(self.page_ids, self.pages):
+            if isinstance(page, ErrorResponse):
+                sections.append(f"Page {page_id}: Error: {page.error}")
+                continue
+            section = f"Page {page_id}: Type {page.page_type}, {page.element_count} element(s)"
+            if page.elements:
+                section += "\n" + "\n".join(map(_element_line, page.elements))
+            sections.append(section)
+        return f"""Pages Details:
+- Presentation ID: {self.presentation_id}
+- Pages Requested: {len(self.page_ids)}
+
+""" + "\n".join(sections)
+
+
+class ThumbnailResponse(BaseModel):
+    """Response from get_page_thumbnail; str() renders the human-readable summary"""
+    success: bool = Field(description="Whether the operation succeeded")
+    presentation_id: str = Field(description="The ID of the presentation")
+    page_id: str = Field(description="The object ID of the page")
+    thumbnail_size: str = Field(description="The requested thumbnail size")
+    thumbnail_url: str = Field(description="Temporary URL of the PNG thumbnail")
+
+    def __str__(self) -> str:
+        return f"""Thumbnail Generated:
+- Presentation ID: {self.presentation_id}
+- Page ID: {self.page_id}
+- Thumbnail Size: {self.thumbnail_size}
+- Thumbnail URL: {self.thumbnail_url}
+
+You can view or download the thumbnail using the provided URL."""
+
+
+class ThumbnailsResponse(BaseModel):
+    """Response from get_page_thumbnails; str() renders the human-readable summary"""
+    success: bool = Field(description="Whether every thumbnail was generated")
+    presentation_id: str = Field(description="The ID of the presentation")
+    thumbnail_size: str = Field(description="The requested thumbnail size")
+    page_ids: list[str] = Field(description="The requested page IDs, in the order given")
+    thumbnails: list[Union[ThumbnailResponse, "ErrorResponse"]] = Field(
+        description="Each page's thumbnail, or the error generating it, in the order of page_ids"
+    )
+
+    def __str__(self) -> str:
+        lines = [
+            f"Page {page_id}: Error: {thumbnail.error}" if isinstance(thumbnail, ErrorResponse)
+            else f"Page {page_id}: {thumbnail.thumbnail_url}"
+            for page_id, thumbnail in zip(self.page_ids, self.thumbnails)
+        ]
+        return f"""Thumbnails Generated:
+- Presentation ID: {self.presentation_id}
+- Pages Requested: {len(self.page_ids)}
+- Thumbnail Size: {self.thumbnail_size}
+
+""" + "\n".join(lines)
+
+
 class AddSlideResponse(BaseModel):
     """Response from add_slide"""
     success: bool = Field(description="Whether the operation succeeded")
@@ -60,6 +239,43 @@ class AddPageWithContentResponse(BaseModel):
     )
 
 
+class AddSlideContentResponse(BaseModel):
+    """Response from add_slide_content"""
+    success: bool = Field(description="Whether the operation succeeded")
+    slide_id: str = Field(description="The ID of the slide the content was added to")
+    presentation_id: str = Field(description="The ID of the presentation")
+    elements_added: list[dict[str, str]] = Field(
+        description="List of elements added with their types and IDs",
+        default_factory=list
+    )
+
+
+class AddManyResponse(BaseModel):
+    """Response from add_many"""
+    success: bool = Field(description="Whether every batch succeeded")
+    presentation_id: str = Field(description="The ID of the presentation")
+    batches_sent: int = Field(description="Number of batch updates sent")
+    batches_failed: int = Field(description="Number of batch updates that failed")
+    errors: list[str] = Field(
+        description="Error message for each failed batch, prefixed with its index",
+        default_factory=list
+    )
+
+
+class BulkApplyResponse(BaseModel):
+    """Response from bulk_apply"""
+    success: bool = Field(description="Whether every presentation was updated")
+    presentations_updated: list[str] = Field(
+        description="IDs of the presentations whose batch update succeeded",
+        default_factory=list
+    )
+    presentations_failed: int = Field(description="Number of presentations whose batch update failed")
+    errors: list[str] = Field(
+        description="Error message for each failed presentation, prefixed with its ID",
+        default_factory=list
+    )
+
+
 class MarkdownToSlidesResponse(BaseModel):
     """Response from create_presentation_from_markdown"""
     success: bool = Field(description="Whether the operation succeeded")
@@ -78,3 +294,8 @@ class ErrorResponse(BaseModel):
     """Error response for any operation"""
     success: bool = Field(default=False, description="Always False for errors")
     error: str = Field(description="Error message describing what went wrong")
+
+
+# The get_pages and get_page_thumbnails responses refer to ErrorResponse before it is defined
+GetPagesResponse.model_rebuild()
+ThumbnailsResponse.model_rebuild()
@@ -4,21 +4,65 @@ Google Slides Service Helper Functions
 This module provides helper functions for Google Slides operations.
 """
 
-import logging
 import asyncio
-from typing import Dict, Any, Optional, Tuple
+import functools
+import ipaddress
+import logging
+import itertools
+import os
+import re
+import socket
+import time
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
 from googleapiclient.errors import HttpError
 
+from gslides import slides_client
+
 logger = logging.getLogger(__name__)
 
-# Counter for sequential object IDs
+# Counters for sequential object IDs; next() on itertools.count is atomic
 _object_id_counters = {
-    'slide': 0,
-    'title': 0,
-    'body': 0,
-    'image': 0
+    prefix: itertools.count(1)
+    for prefix in ('slide', 'title', 'body', 'image')
 }
 
+_PRESENTATION_ID_RE = re.compile(r'/presentation/d/([^/?#]+)')
+
+# Short-lived cache of slide object IDs, so bursts of add_* calls on one
+# presentation don't each re-fetch it: {presentation_id: (expires_at, owner, slide_ids)}
+_SLIDE_IDS_TTL = 5.0
+_SLIDE_IDS_CACHE_SIZE = 128
+_slide_ids_cache: Dict[str, Tuple[float, str, List[str]]] = {}
+
+# Lookups in flight, so concurrent misses on one presentation share a single GET
+_slide_ids_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+# Request kinds that can remove or move slides, so cached IDs can't be patched
+_SLIDE_ORDER_REQUESTS = ('deleteObject', 'duplicateObject', 'updateSlidesPosition')
+
+# Most requests sent in one batchUpdate call
+MAX_BATCH_REQUESTS = 500
+
+# batchUpdate calls to one presentation that arrive this close together share a
+# request. Off by default, since every coalesced call waits out the window
+_COALESCE_WINDOW = max(0.0, float(os.getenv("SLIDES_COALESCE_WINDOW_MS", "0")) / 1000)
+
+# Probing image URLs from this server is opt-in: Slides fetches images from
+# Google's side, while a local probe reaches whatever host a caller names
+_IMAGE_CHECK_ENABLED = os.getenv("SLIDES_CHECK_IMAGE_URLS", "").lower() in ("1", "true", "yes")
+
+# Seconds to wait on an image host before letting Slides try the URL itself
+_IMAGE_CHECK_TIMEOUT = 2.0
+
+# The SlideBuilder open in the current task, if any
+_active_slide_builder: ContextVar[Optional['SlideBuilder']] = ContextVar(
+    'active_slide_builder', default=None
+)
+
 
 def generate_object_id(prefix: str) -> str:
     """
@@ -30,8 +74,25 @@ def generate_object_id(prefix: str) -> str:
     Returns:
         A unique object ID like 'title_1', 'body_2', etc.
     """
-    _object_id_counters[prefix] += 1
-    return f"{prefix}_{_object_id_counters[prefix]}"
+    return f"{prefix}_{next(_object_id_counters[prefix])}"
+
+
+def generate_object_ids(prefixes: List[Optional[str]]) -> List[Optional[str]]:
+    """
+    Generate one sequential object ID per prefix in a single call.
+
+    Args:
+        prefixes: Prefixes as for generate_object_id; a None entry yields None,
+            so optional elements can be numbered alongside required ones
+
+    Returns:
+        The object IDs, in the same order as prefixes
+    """
+    counters = _object_id_counters
+    return [
+        f"{prefix}_{next(counters[prefix])}" if prefix is not None else None
+        for prefix in prefixes
+    ]
 
 
 async def get_slide_by_position(
@@ -42,6 +103,8 @@ async def get_slide_by_position(
     """
     Get slide ID by position ('first', 'last', or specific slide_id).
 
+    Only slide object IDs are fetched from the API, not slide content.
+
     Args:
         service: The Google Slides service instance
         presentation_id: The presentation ID
@@ -53,38 +116,129 @@ async def get_slide_by_position(
     Raises:
         ValueError: If position is invalid or slide not found
     """
-    # Get the presentation
-    result = await asyncio.to_thread(
-        service.presentations().get(presentationId=presentation_id).execute
-    )
-
-    slides = result.get('slides', [])
+    slide_ids = await _get_slide_ids(service, presentation_id)
 
-    if not slides:
+    if not slide_ids:
         raise ValueError(f"Presentation has no slides. Create a slide first.")
 
     # Handle position
     if position == "first":
-        return slides[0].get('objectId'), len(slides)
+        return slide_ids[0], len(slide_ids)
     elif position == "last":
-        return slides[-1].get('objectId'), len(slides)
+        return slide_ids[-1], len(slide_ids)
     else:
         # Check if the specific slide_id exists
-        slide_ids = [slide.get('objectId') for slide in slides]
         if position in slide_ids:
-            return position, len(slides)
+            return position, len(slide_ids)
         else:
             available_ids = ', '.join(slide_ids[:3])
             if len(slide_ids) > 3:
                 available_ids += f", ... ({len(slide_ids)} total)"
             raise ValueError(
                 f"Slide '{position}' not found. "
-                f"Presentation has {len(slides)} slide(s). "
+                f"Presentation has {len(slide_ids)} slide(s). "
                 f"Available slide IDs: {available_ids}"
             )
 
 
-async def extract_presentation_id_from_url(presentation_url: str) -> str:
+async def _get_slide_ids(service, presentation_id: str) -> List[str]:
+    """
+    Fetch the slide object IDs of a presentation, reusing a recent result.
+
+    Entries are tied to the caller's credentials owner so one user's lookup is
+    never served to another; callers without one always fetch. The request asks
+    for fields='slides/objectId' only; read anything else from the presentation
+    and it must be added there.
+    """
+    owner = slides_client.credentials_owner(slides_client.service_credentials(service))
+    if owner is None:
+        result = await slides_client.get_presentation(
+            service, presentation_id, fields='slides/objectId'
+        )
+        return [slide.get('objectId') for slide in result.get('slides', [])]
+
+    now = time.monotonic()
+
+    cached = _slide_ids_cache.get(presentation_id)
+    if cached and cached[0] > now and cached[1] == owner:
+        return cached[2]
+
+    key = (presentation_id, owner)
+    lookup = _slide_ids_inflight.get(key)
+    if lookup is None:
+        lookup = asyncio.ensure_future(_fetch_slide_ids(service, presentation_id, owner))
+        _slide_ids_inflight[key] = lookup
+        lookup.add_done_callback(lambda _: _slide_ids_inflight.pop(key, None))
+    # Shielded so one caller giving up doesn't cancel the lookup for the others
+    return await asyncio.shield(lookup)
+
+
+async def _fetch_slide_ids(service, presentation_id: str, owner: str) -> List[str]:
+    """Fetch slide object IDs from the API and cache them for the owner."""
+    # Partial response: only slides[].objectId is returned, nothing else may be read
+    result = await slides_client.get_presentation(
+        service, presentation_id, fields='slides/objectId'
+    )
+    slide_ids = [slide.get('objectId') for slide in result.get('slides', [])]
+
+    now = time.monotonic()
+    if len(_slide_ids_cache) >= _SLIDE_IDS_CACHE_SIZE:
+        for key in [key for key, entry in _slide_ids_cache.items() if entry[0] <= now]:
+            del _slide_ids_cache[key]
+        while len(_slide_ids_cache) >= _SLIDE_IDS_CACHE_SIZE:
+            del _slide_ids_cache[next(iter(_slide_ids_cache))]
+    _slide_ids_cache[presentation_id] = (now + _SLIDE_IDS_TTL, owner, slide_ids)
+    return slide_ids
+
+
+def invalidate_slide_cache(presentation_id: str) -> None:
+    """
+    Drop cached slide IDs for a presentation.
+
+    Call after any write that may add, remove or reorder slides.
+    """
+    _slide_ids_cache.pop(presentation_id, None)
+
+
+def record_slide_changes(
+    presentation_id: str,
+    requests: List[Dict[str, Any]],
+    replies: List[Dict[str, Any]]
+) -> None:
+    """
+    Update cached slide IDs after a successful batchUpdate.
+
+    Slides added by createSlide are inserted into the cached list, so the next
+    'last' lookup doesn't re-fetch the presentation. Requests that may delete
+    or reorder slides drop the entry instead. The entry keeps its original
+    expiry either way.
+    """
+    cached = _slide_ids_cache.get(presentation_id)
+    if cached is None:
+        return
+
+    if any(kind in request for request in requests for kind in _SLIDE_ORDER_REQUESTS):
+        invalidate_slide_cache(presentation_id)
+        return
+
+    slide_ids = list(cached[2])
+    for request, reply in itertools.zip_longest(requests, replies, fillvalue={}):
+        create = request.get('createSlide')
+        if create is None:
+            continue
+
+        # The reply has the ID when the request left it to the server
+        object_id = (reply or {}).get('createSlide', {}).get('objectId') or create.get('objectId')
+        if object_id is None:
+            invalidate_slide_cache(presentation_id)
+            return
+        slide_ids.insert(create.get('insertionIndex', len(slide_ids)), object_id)
+
+    _slide_ids_cache[presentation_id] = (cached[0], cached[1], slide_ids)
+
+
+@functools.lru_cache(maxsize=256)
+def extract_presentation_id_from_url(presentation_url: str) -> str:
     """
     Extract presentation ID from a Google Slides URL.
 
@@ -94,21 +248,124 @@ async def extract_presentation_id_from_url(presentation_url: str) -> str:
     Returns:
         The presentation ID
     """
-    # If it's already just an ID (no slashes), return it
+    # A bare ID needs no parsing
     if '/' not in presentation_url:
         return presentation_url
 
-    # Extract from URL: https://docs.google.com/presentation/d/{id}/edit
-    if '/presentation/d/' in presentation_url:
-        parts = presentation_url.split('/presentation/d/')
-        if len(parts) > 1:
-            presentation_id = parts[1].split('/')[0]
-            # Remove any URL fragments or query params
-            presentation_id = presentation_id.split('?')[0].split('#')[0]
-            return presentation_id
+    # https://docs.google.com/presentation/d/{id}/edit, without query or fragment
+    match = _PRESENTATION_ID_RE.search(presentation_url)
 
     # If we can't parse it, assume it's an ID
-    return presentation_url
+    return match.group(1) if match else presentation_url
+
+
+async def _require_public_host(host: str, image_url: str) -> None:
+    """
+    Resolve the image host and make sure every address it maps to is public.
+
+    Raises:
+        ValueError: If the host doesn't resolve or resolves to a private,
+            loopback, link-local or otherwise non-global address
+    """
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        raise ValueError(f"Image URL is not reachable: {image_url} ({e})")
+
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0].split('%', 1)[0])
+        if not address.is_global:
+            raise ValueError(f"Image URL must point to a public host: {image_url}")
+
+
+async def validate_image_url(
+    image_url: str,
+    timeout: float = _IMAGE_CHECK_TIMEOUT,
+    probe: bool = True
+) -> None:
+    """
+    Check that an image URL is one Slides can fetch before asking it to.
+
+    Only http and https URLs are accepted. When SLIDES_CHECK_IMAGE_URLS is
+    set and probe is true, the URL is also probed with a HEAD request, but only if its host
+    resolves to public addresses, and redirects are not followed. Only clear
+    failures are reported: unreachable hosts and 404/410. Timeouts and other
+    statuses pass, since some hosts answer HEAD differently from the GET that
+    Slides will make.
+
+    Raises:
+        ValueError: If the image URL is clearly unusable
+    """
+    parts = urlsplit(image_url)
+    if parts.scheme.lower() not in ('http', 'https') or not parts.hostname:
+        raise ValueError(f"Image URL must be an http or https URL: {image_url}")
+
+    if not (probe and _IMAGE_CHECK_ENABLED):
+        return
+
+    await _require_public_host(parts.hostname, image_url)
+    try:
+        response = await slides_client.head(image_url, timeout)
+    except httpx.TimeoutException:
+        return
+    except (httpx.TransportError, httpx.InvalidURL) as e:
+        raise ValueError(f"Image URL is not reachable: {image_url} ({e})")
+
+    if response.status_code in (404, 410):
+        raise ValueError(f"Image URL returned HTTP {response.status_code}: {image_url}")
+
+
+@functools.lru_cache(maxsize=256)
+def _element_size(size_height: int, size_width: int) -> dict:
+    return {
+        'height': {'magnitude': size_height, 'unit': 'PT'},
+        'width': {'magnitude': size_width, 'unit': 'PT'}
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _element_transform(x: int, y: int) -> dict:
+    return {
+        'scaleX': 1,
+        'scaleY': 1,
+        'translateX': x,
+        'translateY': y,
+        'unit': 'PT'
+    }
+
+
+def _element_properties(
+    page_id: str,
+    size_height: int,
+    size_width: int,
+    x: int,
+    y: int
+) -> dict:
+    """
+    Build the elementProperties for a page element placed at (x, y) in points.
+
+    The size and transform dicts are cached and shared between requests with
+    the same geometry, so they must not be modified.
+    """
+    return {
+        'pageObjectId': page_id,
+        'size': _element_size(size_height, size_width),
+        'transform': _element_transform(x, y)
+    }
+
+
+def create_slide_request(object_id: str, layout: str = 'BLANK') -> dict:
+    """
+    Create request for adding a slide with a predefined layout.
+    """
+    return {
+        'createSlide': {
+            'objectId': object_id,
+            'slideLayoutReference': {
+                'predefinedLayout': layout
+            }
+        }
+    }
 
 
 def create_text_box_request(
@@ -118,42 +375,32 @@ def create_text_box_request(
     size_height: int,
     size_width: int,
     x: int,
-    y: int
+    y: int,
+    out: Optional[list] = None
 ) -> list:
     """
     Create requests for adding a text box to a slide.
 
-    Returns a list of 2 requests: createShape and insertText
+    Returns a list of 2 requests: createShape and insertText. Pass out to
+    append them to an existing request list instead; out is returned.
     """
-    return [
-        {
-            'createShape': {
-                'objectId': object_id,
-                'shapeType': 'TEXT_BOX',
-                'elementProperties': {
-                    'pageObjectId': page_id,
-                    'size': {
-                        'height': {'magnitude': size_height, 'unit': 'PT'},
-                        'width': {'magnitude': size_width, 'unit': 'PT'}
-                    },
-                    'transform': {
-                        'scaleX': 1,
-                        'scaleY': 1,
-                        'translateX': x,
-                        'translateY': y,
-                        'unit': 'PT'
-                    }
-                }
-            }
-        },
-        {
-            'insertText': {
-                'objectId': object_id,
-                'text': text,
-                'insertionIndex': 0
-            }
+    if out is None:
+        out = []
+    out.append({
+        'createShape': {
+            'objectId': object_id,
+            'shapeType': 'TEXT_BOX',
+            'elementProperties': _element_properties(page_id, size_height, size_width, x, y)
         }
-    ]
+    })
+    out.append({
+        'insertText': {
+            'objectId': object_id,
+            'text': text,
+            'insertionIndex': 0
+        }
+    })
+    return out
 
 
 def create_image_request(
@@ -172,19 +419,252 @@ def create_image_request(
         'createImage': {
             'objectId': object_id,
             'url': image_url,
-            'elementProperties': {
-                'pageObjectId': page_id,
-                'size': {
-                    'height': {'magnitude': size_height, 'unit': 'PT'},
-                    'width': {'magnitude': size_width, 'unit': 'PT'}
-                },
-                'transform': {
-                    'scaleX': 1,
-                    'scaleY': 1,
-                    'translateX': x,
-                    'translateY': y,
-                    'unit': 'PT'
-                }
-            }
+            'elementProperties': _element_properties(page_id, size_height, size_width, x, y)
         }
     }
+
+
+class SlidesRequestBatcher:
+    """
+    Collects Slides API requests so they can be sent in one batchUpdate call.
+
+    Each batchUpdate is a full HTTP round-trip, so building every request up
+    front and flushing once is much faster than one call per slide. The API
+    applies a batch atomically: if flush fails, nothing in it was applied.
+    """
+
+    def __init__(self):
+        self._requests: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    @property
+    def requests(self) -> List[Dict[str, Any]]:
+        """The pending requests, in submission order"""
+        return self._requests
+
+    def add_slide(self, object_id: str, layout: str = 'BLANK') -> None:
+        """Queue a createSlide request using a predefined layout."""
+        self._requests.append(create_slide_request(object_id, layout))
+
+    def add_text_box(
+        self,
+        object_id: str,
+        page_id: str,
+        text: str,
+        size_height: int,
+        size_width: int,
+        x: int,
+        y: int
+    ) -> None:
+        """Queue the createShape and insertText requests for a text box."""
+        create_text_box_request(
+            object_id, page_id, text, size_height, size_width, x, y, out=self._requests
+        )
+
+    def add_image(
+        self,
+        object_id: str,
+        page_id: str,
+        image_url: str,
+        size_height: int,
+        size_width: int,
+        x: int,
+        y: int
+    ) -> None:
+        """Queue a createImage request."""
+        self._requests.append(
+            create_image_request(object_id, page_id, image_url, size_height, size_width, x, y)
+        )
+
+    def extend(self, requests: List[Dict[str, Any]]) -> None:
+        """Queue already-built requests."""
+        self._requests.extend(requests)
+
+    async def flush(self, service, presentation_id: str) -> Dict[str, Any]:
+        """
+        Send all pending requests in a single batchUpdate call.
+
+        Args:
+            service: The Google Slides service instance
+            presentation_id: The presentation ID
+
+        Returns:
+            The batchUpdate response, or an empty dict if nothing was pending
+
+        Raises:
+            HttpError: If the API rejects the batch. Pending requests are kept.
+        """
+        if not self._requests:
+            return {}
+
+        result = await slides_client.batch_update(service, presentation_id, self._requests)
+        self._requests = []
+        return result
+
+
+class SlideBuilder(SlidesRequestBatcher):
+    """
+    Async context manager that sends every request queued inside it in one batchUpdate.
+
+    While a builder is open, add_slide, add_title, add_body_text and
+    add_body_image calls for the same presentation queue their requests on it
+    instead of each making their own round-trip. The batch is sent when the
+    block exits without an exception; on error nothing is sent.
+
+        async with SlideBuilder(service, presentation_id) as builder:
+            ...
+        builder.response  # the batchUpdate response
+    """
+
+    def __init__(self, service, presentation_id: str):
+        super().__init__()
+        self.service = service
+        self.presentation_id = presentation_id
+        self.response: Optional[Dict[str, Any]] = None
+        self._slide_ids: List[str] = []
+        self._token = None
+
+    def add_slide(self, object_id: str, layout: str = 'BLANK') -> None:
+        """Queue a createSlide request and remember the slide for later lookups."""
+        super().add_slide(object_id, layout)
+        self._slide_ids.append(object_id)
+
+    def pending_slide(self, position: str) -> Optional[str]:
+        """
+        Resolve a position against slides queued on this builder.
+
+        Returns the slide ID for 'last' or a queued slide ID, or None when the
+        position has to be looked up in the presentation itself.
+        """
+        if position == 'last' and self._slide_ids:
+            return self._slide_ids[-1]
+        if position in self._slide_ids:
+            return position
+        return None
+
+    async def __aenter__(self) -> 'SlideBuilder':
+        self._token = _active_slide_builder.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        _active_slide_builder.reset(self._token)
+        if exc_type is not None:
+            return
+
+        requests = self._requests
+        self.response = await self.flush(self.service, self.presentation_id)
+        record_slide_changes(self.presentation_id, requests, self.response.get('replies', []))
+
+
+def get_active_slide_builder(presentation_id: str) -> Optional[SlideBuilder]:
+    """Return the open SlideBuilder for this presentation, if there is one."""
+    builder = _active_slide_builder.get()
+    if builder is not None and builder.presentation_id == presentation_id:
+        return builder
+    return None
+
+
+class SlideBatchCoalescer:
+    """
+    Merges batchUpdate calls to the same presentation made within a short window.
+
+    Tools that each send a small batch moments apart, like add_title followed
+    by add_body_text, then share one round-trip. Submissions are only merged
+    when their credentials carry the same client ID and refresh token, and
+    never when there is no refresh token. If a merged batch is rejected as
+    invalid (400), each submission is retried on its own so only the invalid
+    one fails; any other error fails the whole batch without retrying.
+
+    With a window of 0 (the default, see SLIDES_COALESCE_WINDOW_MS) nothing
+    is merged and each submission is sent straight away.
+    """
+
+    def __init__(self, window: float = _COALESCE_WINDOW):
+        self.window = window
+        # {(presentation_id, owner): [(service, requests, future), ...]}
+        self._pending: Dict[Tuple[str, Optional[str]], List[Tuple[Any, List[Dict[str, Any]], asyncio.Future]]] = {}
+        # Strong references, so the event loop doesn't drop running flushes
+        self._tasks: set = set()
+
+    async def submit(
+        self,
+        service,
+        presentation_id: str,
+        requests: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Queue requests for the next batchUpdate to this presentation.
+
+        Returns:
+            The replies for these requests only
+
+        Raises:
+            HttpError: If the API rejects these requests
+        """
+        # Only merge calls known to come from the same user; the batch is sent with one service
+        owner = slides_client.credentials_owner(slides_client.service_credentials(service))
+        if self.window <= 0 or owner is None or len(requests) >= MAX_BATCH_REQUESTS:
+            result = await slides_client.batch_update(service, presentation_id, requests)
+            return result.get('replies', [])
+
+        key = (presentation_id, owner)
+        future = asyncio.get_running_loop().create_future()
+
+        batch = self._pending.get(key)
+        if batch is not None and sum(len(queued) for _, queued, _ in batch) + len(requests) > MAX_BATCH_REQUESTS:
+            # Full: send what's queued now and start a new window
+            del self._pending[key]
+            self._spawn(self._send(presentation_id, batch))
+            batch = None
+        if batch is None:
+            batch = self._pending[key] = []
+            self._spawn(self._flush_after(key, batch))
+        batch.append((service, requests, future))
+
+        return await future
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_after(self, key, batch) -> None:
+        await asyncio.sleep(self.window)
+        # Already sent if it filled up during the window
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+            await self._send(key[0], batch)
+
+    async def _send(self, presentation_id: str, batch) -> None:
+        service = batch[0][0]
+        merged = [request for _, requests, _ in batch for request in requests]
+        try:
+            result = await slides_client.batch_update(service, presentation_id, merged)
+        except Exception as e:
+            if isinstance(e, HttpError) and e.resp.status == 400 and len(batch) > 1:
+                # One submission is invalid; find it without failing the others
+                await asyncio.gather(*(self._send(presentation_id, [entry]) for entry in batch))
+                return
+            # Throttling and auth errors would only repeat, so fail everyone now
+            for _, _, future in batch:
+                _set_future(future, exception=e)
+            return
+
+        # Hand each submitter the slice of replies for its own requests
+        replies = result.get('replies', [])
+        start = 0
+        for _, requests, future in batch:
+            _set_future(future, result=replies[start:start + len(requests)])
+            start += len(requests)
+
+
+def _set_future(future: asyncio.Future, result: Any = None, exception: Optional[BaseException] = None) -> None:
+    """Resolve a submitter's future unless it already gave up waiting."""
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
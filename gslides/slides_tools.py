@@ -6,9 +6,11 @@ This module provides MCP tools for interacting with Google Slides API.
 
 import logging
 import asyncio
-from typing import List, Optional, Dict, Any
+import itertools
+import os
+from contextlib import nullcontext
+from typing import List, Optional, Dict, Any, Tuple
 
-from mcp import types
 from fastmcp import Context
 from googleapiclient.errors import HttpError
 
@@ -16,27 +18,147 @@ from auth.service_decorator import require_google_service
 from core.server import server
 from core.utils import handle_http_errors
 from core.comments import create_comment_tools
+from gslides import slides_client
 from gslides.slides_service import (
     generate_object_id,
+    generate_object_ids,
+    MAX_BATCH_REQUESTS,
     get_slide_by_position,
+    invalidate_slide_cache,
+    record_slide_changes,
     extract_presentation_id_from_url,
+    create_slide_request,
     create_text_box_request,
-    create_image_request
+    create_image_request,
+    validate_image_url,
+    get_active_slide_builder,
+    SlideBatchCoalescer,
+    SlideBuilder,
+    SlidesRequestBatcher
 )
 from gslides.slides_models import (
     CreatePresentationResponse,
+    GetPresentationResponse,
+    BatchUpdateResponse,
+    GetPageResponse,
+    GetPagesResponse,
+    ThumbnailResponse,
+    ThumbnailsResponse,
     AddSlideResponse,
     AddTitleResponse,
     AddBodyTextResponse,
     AddBodyImageResponse,
     AddPageWithContentResponse,
+    AddSlideContentResponse,
+    AddManyResponse,
+    BulkApplyResponse,
     MarkdownToSlidesResponse,
     ErrorResponse
 )
-from gslides.markdown_parser import parse_markdown_to_slides
+from gslides.markdown_parser import get_cached_markdown_parse, parse_markdown_to_slides_cached
 
 logger = logging.getLogger(__name__)
 
+_batch_coalescer = SlideBatchCoalescer()
+
+# Upper bound on concurrent page fetches in get_pages and get_page_thumbnails, to stay within API quotas
+_GET_PAGES_CONCURRENCY = 20
+
+# Upper bound on per-slide batchUpdates in flight when a markdown deck batch falls back
+_SLIDE_FALLBACK_CONCURRENCY = max(1, int(os.getenv("SLIDES_MAX_CONCURRENCY", "16")))
+
+# Most distinct image URLs probed for one markdown deck; the rest only get the
+# scheme check and are left for Slides to fetch
+_MAX_IMAGE_PROBES = 20
+
+# Thumbnail sizes Slides accepts; anything else would 400 after a round trip
+_THUMBNAIL_SIZES = frozenset({'SMALL', 'MEDIUM', 'LARGE'})
+
+
+def _validate_thumbnail_size(thumbnail_size: str) -> None:
+    if thumbnail_size not in _THUMBNAIL_SIZES:
+        raise ValueError(
+            f"Invalid thumbnail_size '{thumbnail_size}'. Use one of: {', '.join(sorted(_THUMBNAIL_SIZES))}"
+        )
+
+
+async def _resolve_slide_id(service, presentation_id: str, page_id: str) -> str:
+    """Resolve page_id, including slides still queued on an open SlideBuilder."""
+    builder = get_active_slide_builder(presentation_id)
+    if builder is not None:
+        slide_id = builder.pending_slide(page_id)
+        if slide_id is not None:
+            return slide_id
+
+    slide_id, total_slides = await get_slide_by_position(service, presentation_id, page_id)
+    return slide_id
+
+
+async def _add_slide_content(
+    service,
+    presentation_id: str,
+    page_id: str,
+    title: Optional[str] = None,
+    title_box: Tuple[int, int, int, int] = (50, 600, 50, 50),
+    body_text: Optional[str] = None,
+    body_box: Tuple[int, int, int, int] = (200, 600, 50, 100),
+    image_url: Optional[str] = None,
+    image_box: Tuple[int, int, int, int] = (150, 200, 100, 50)
+) -> Tuple[str, List[Dict[str, str]]]:
+    """
+    Add any of a title, body text and image to an existing slide in one batchUpdate.
+
+    Boxes are (height, width, x, y) in points. The slide lookup runs alongside
+    the image URL check, so a bad URL fails before anything is written.
+
+    Returns:
+        The resolved slide ID and the elements added, as for add_page_with_content
+    """
+    lookup = _resolve_slide_id(service, presentation_id, page_id)
+    if image_url is not None:
+        slide_id, _ = await asyncio.gather(lookup, validate_image_url(image_url))
+    else:
+        slide_id = await lookup
+
+    title_id, body_id, image_id = generate_object_ids([
+        'title' if title is not None else None,
+        'body' if body_text is not None else None,
+        'image' if image_url is not None else None
+    ])
+
+    requests = []
+    elements_added = []
+    if title is not None:
+        create_text_box_request(title_id, slide_id, title, *title_box, out=requests)
+        elements_added.append({"type": "title", "object_id": title_id})
+    if body_text is not None:
+        create_text_box_request(body_id, slide_id, body_text, *body_box, out=requests)
+        elements_added.append({"type": "body_text", "object_id": body_id})
+    if image_url is not None:
+        requests.append(create_image_request(image_id, slide_id, image_url, *image_box))
+        elements_added.append({"type": "image", "object_id": image_id})
+
+    # Execute the batch update, or queue it on an open SlideBuilder
+    await _submit_requests(service, presentation_id, requests)
+    return slide_id, elements_added
+
+
+def _slide_builder(service, presentation_id: str):
+    """Join the open SlideBuilder for this presentation, or start a new one."""
+    builder = get_active_slide_builder(presentation_id)
+    if builder is not None:
+        return nullcontext(builder)
+    return SlideBuilder(service, presentation_id)
+
+
+async def _submit_requests(service, presentation_id: str, requests: List[Dict[str, Any]]) -> None:
+    """Queue requests on the open SlideBuilder for this presentation, or send them with the next coalesced batch."""
+    builder = get_active_slide_builder(presentation_id)
+    if builder is not None:
+        builder.extend(requests)
+    else:
+        await _batch_coalescer.submit(service, presentation_id, requests)
+
 
 @server.tool
 @require_google_service("slides", "slides")
@@ -63,21 +185,19 @@ async def create_presentation(
     Returns:
         str: Details about the created presentation including ID and URL.
     """
-    logger.info(f"[create_presentation] Invoked. Email: '{user_google_email}', Title: '{title}'")
+    logger.info("[create_presentation] Invoked. Email: '%s', Title: '%s'", user_google_email, title)
 
     body = {
         'title': title
     }
     
-    result = await asyncio.to_thread(
-        service.presentations().create(body=body).execute
-    )
+    result = await slides_client.create_presentation(service, body)
 
     presentation_id = result.get('presentationId')
     presentation_url = f"https://docs.google.com/presentation/d/{presentation_id}/edit"
     slides = result.get('slides', [])
 
-    logger.info(f"Presentation created successfully for {user_google_email}")
+    logger.info("Presentation created successfully for %s", user_google_email)
     return CreatePresentationResponse(
         success=True,
         presentation_id=presentation_id,
@@ -94,10 +214,11 @@ async def get_presentation(
     service,
     ctx: Context,
     presentation_id: str,
-    user_google_email: Optional[str] = None
-):
+    user_google_email: Optional[str] = None,
+    verbose: bool = False
+) -> GetPresentationResponse:
     """
-    <description>Retrieves presentation metadata including title, slide count, page dimensions, and basic slide structure. Shows presentation overview without detailed slide content.</description>
+    <description>Retrieves presentation metadata including title, slide count, and page dimensions. With verbose=True, also lists every slide with its ID and element count. Shows presentation overview without detailed slide content.</description>
     
     <use_case>Inspecting presentation structure before modification, understanding slide organization for automation, or getting presentation metadata for documentation.</use_case>
     
@@ -108,38 +229,74 @@ async def get_presentation(
     Args:
         user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
         presentation_id (str): The ID of the presentation to retrieve.
+        verbose (bool): Include the per-slide breakdown. Defaults to False.
 
     Returns:
-        str: Details about the presentation including title, slides count, and metadata.
+        GetPresentationResponse: Title, slide count, page size and revision ID; str() gives a readable summary.
     """
-    logger.info(f"[get_presentation] Invoked. Email: '{user_google_email}', ID: '{presentation_id}'")
-
-    result = await asyncio.to_thread(
-        service.presentations().get(presentationId=presentation_id).execute
+    logger.info("[get_presentation] Invoked. Email: '%s', ID: '%s'", user_google_email, presentation_id)
+
+    # Partial response: only the fields summarized below are downloaded
+    result = await slides_client.get_presentation(
+        service,
+        presentation_id,
+        fields=(
+            'title,revisionId,pageSize,slides(objectId,pageElements/objectId)'
+            if verbose else 'title,revisionId,pageSize,slides/objectId'
+        )
     )
     
-    title = result.get('title', 'Untitled')
     slides = result.get('slides', [])
-    page_size = result.get('pageSize', {})
-    
-    slides_info = []
-    for i, slide in enumerate(slides, 1):
-        slide_id = slide.get('objectId', 'Unknown')
-        page_elements = slide.get('pageElements', [])
-        slides_info.append(f"  Slide {i}: ID {slide_id}, {len(page_elements)} element(s)")
-    
-    confirmation_message = f"""Presentation Details for {user_google_email}:
-- Title: {title}
-- Presentation ID: {presentation_id}
-- URL: https://docs.google.com/presentation/d/{presentation_id}/edit
-- Total Slides: {len(slides)}
-- Page Size: {page_size.get('width', {}).get('magnitude', 'Unknown')} x {page_size.get('height', {}).get('magnitude', 'Unknown')} {page_size.get('width', {}).get('unit', '')}
-
-Slides Breakdown:
-{chr(10).join(slides_info) if slides_info else '  No slides found'}"""
-    
-    logger.info(f"Presentation retrieved successfully for {user_google_email}")
-    return confirmation_message
+    page_width = result.get('pageSize', {}).get('width', {})
+    page_height = result.get('pageSize', {}).get('height', {})
+
+    logger.info("Presentation retrieved successfully for %s", user_google_email)
+    return GetPresentationResponse(
+        success=True,
+        presentation_id=presentation_id,
+        presentation_url=f"https://docs.google.com/presentation/d/{presentation_id}/edit",
+        title=result.get('title', 'Untitled'),
+        revision_id=result.get('revisionId'),
+        slide_count=len(slides),
+        page_width=page_width.get('magnitude'),
+        page_height=page_height.get('magnitude'),
+        page_size_unit=page_width.get('unit', ''),
+        slides=[
+            {
+                'slide_id': slide.get('objectId', 'Unknown'),
+                'element_count': len(slide.get('pageElements', ()))
+            }
+            for slide in slides
+        ] if verbose else None
+    )
+
+
+def _describe_created(noun: str):
+    return lambda body: f"Created {noun} with ID {body.get('objectId', 'Unknown')}"
+
+
+# Reply kind -> formatter(index, reply body); a reply holds exactly one kind
+_REPLY_FORMATTERS = {
+    'createSlide': _describe_created('slide'),
+    'createShape': _describe_created('shape'),
+    'createImage': _describe_created('image'),
+    'createTable': _describe_created('table'),
+    'createLine': _describe_created('line'),
+    'createVideo': _describe_created('video'),
+    'createSheetsChart': _describe_created('chart'),
+    'groupObjects': _describe_created('group'),
+    'duplicateObject': lambda body: f"Duplicated object as ID {body.get('objectId', 'Unknown')}",
+    'replaceAllText': lambda body: f"Replaced {body.get('occurrencesChanged', 0)} occurrence(s)",
+}
+
+
+def _describe_reply(reply: Dict[str, Any]) -> str:
+    """Describe the outcome of one batchUpdate request from its reply."""
+    kind = next(iter(reply), None)
+    formatter = _REPLY_FORMATTERS.get(kind)
+    if formatter is None:
+        return "Operation completed"
+    return formatter(reply[kind])
 
 
 @server.tool
@@ -150,60 +307,76 @@ async def batch_update_presentation(
     ctx: Context,
     presentation_id: str,
     requests: List[Dict[str, Any]],
-    user_google_email: Optional[str] = None
-):
+    user_google_email: Optional[str] = None,
+    required_revision_id: Optional[str] = None
+) -> BatchUpdateResponse:
     """
-    <description>Executes multiple presentation modifications in a single atomic operation including adding slides, inserting text, creating shapes, and applying formatting. All changes succeed or fail together.</description>
+    <description>Executes multiple presentation modifications in a single atomic operation including adding slides, inserting text, creating shapes, and applying formatting. All changes succeed or fail together. Optionally applies the changes only if nobody has edited the presentation since a known revision.</description>
     
     <use_case>Automating slide creation, bulk formatting changes, inserting multiple elements across slides, or applying consistent styling to entire presentations programmatically.</use_case>
     
     <limitation>Requires knowledge of Google Slides API request structure. Limited to 500 requests per batch. Cannot undo individual operations - entire batch must be reverted.</limitation>
     
-    <failure_cases>Fails if any single request in the batch is invalid, if user lacks edit permissions, or if presentation is locked by another user during the operation.</failure_cases>
+    <failure_cases>Fails if any single request in the batch is invalid, if user lacks edit permissions, or if presentation is locked by another user during the operation. With required_revision_id, fails without applying anything if the presentation has changed since that revision.</failure_cases>
 
     Args:
         user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
         presentation_id (str): The ID of the presentation to update.
         requests (List[Dict[str, Any]]): List of update requests to apply.
+        required_revision_id (Optional[str]): Revision ID from get_presentation or a previous batch update. If set, the batch is rejected when the presentation is no longer at this revision.
 
     Returns:
-        str: Details about the batch update operation results.
+        BatchUpdateResponse: Outcome of each request and the new revision ID; str() gives a readable summary.
     """
-    logger.info(f"[batch_update_presentation] Invoked. Email: '{user_google_email}', ID: '{presentation_id}', Requests: {len(requests)}")
+    logger.info("[batch_update_presentation] Invoked. Email: '%s', ID: '%s', Requests: %s", user_google_email, presentation_id, len(requests))
 
-    body = {
-        'requests': requests
-    }
-    
-    result = await asyncio.to_thread(
-        service.presentations().batchUpdate(
-            presentationId=presentation_id,
-            body=body
-        ).execute
-    )
-    
+    try:
+        result = await slides_client.batch_update(
+            service, presentation_id, requests, required_revision_id=required_revision_id
+        )
+    except HttpError:
+        # A revision mismatch means someone else changed the deck; cached slide IDs may be stale
+        if required_revision_id:
+            invalidate_slide_cache(presentation_id)
+        raise
     replies = result.get('replies', [])
-    
-    confirmation_message = f"""Batch Update Completed for {user_google_email}:
-- Presentation ID: {presentation_id}
-- URL: https://docs.google.com/presentation/d/{presentation_id}/edit
-- Requests Applied: {len(requests)}
-- Replies Received: {len(replies)}"""
-    
-    if replies:
-        confirmation_message += "\n\nUpdate Results:"
-        for i, reply in enumerate(replies, 1):
-            if 'createSlide' in reply:
-                slide_id = reply['createSlide'].get('objectId', 'Unknown')
-                confirmation_message += f"\n  Request {i}: Created slide with ID {slide_id}"
-            elif 'createShape' in reply:
-                shape_id = reply['createShape'].get('objectId', 'Unknown')
-                confirmation_message += f"\n  Request {i}: Created shape with ID {shape_id}"
-            else:
-                confirmation_message += f"\n  Request {i}: Operation completed"
-    
-    logger.info(f"Batch update completed successfully for {user_google_email}")
-    return confirmation_message
+    record_slide_changes(presentation_id, requests, replies)
+
+    logger.info("Batch update completed successfully for %s", user_google_email)
+    return BatchUpdateResponse(
+        success=True,
+        presentation_id=presentation_id,
+        presentation_url=f"https://docs.google.com/presentation/d/{presentation_id}/edit",
+        requests_applied=len(requests),
+        revision_id=result.get('writeControl', {}).get('requiredRevisionId'),
+        results=list(map(_describe_reply, replies))
+    )
+
+
+def _summarize_page_element(element: Dict[str, Any]) -> Dict[str, str]:
+    """Summarize one page element as its object_id, kind and detail."""
+    element_id = element.get('objectId', 'Unknown')
+    if 'shape' in element:
+        return {'object_id': element_id, 'kind': 'Shape', 'detail': f"Type: {element['shape'].get('shapeType', 'Unknown')}"}
+    if 'table' in element:
+        table = element['table']
+        return {'object_id': element_id, 'kind': 'Table', 'detail': f"Size: {table.get('rows', 0)}x{table.get('columns', 0)}"}
+    if 'line' in element:
+        return {'object_id': element_id, 'kind': 'Line', 'detail': f"Type: {element['line'].get('lineType', 'Unknown')}"}
+    return {'object_id': element_id, 'kind': 'Element', 'detail': "Type: Unknown"}
+
+
+def _page_response(presentation_id: str, page_id: str, page: Dict[str, Any], verbose: bool) -> GetPageResponse:
+    """Build the get_page response for one fetched page."""
+    page_elements = page.get('pageElements', [])
+    return GetPageResponse(
+        success=True,
+        presentation_id=presentation_id,
+        page_id=page_id,
+        page_type=page.get('pageType', 'Unknown'),
+        element_count=len(page_elements),
+        elements=list(map(_summarize_page_element, page_elements)) if verbose else None
+    )
 
 
 @server.tool
@@ -214,10 +387,11 @@ async def get_page(
     ctx: Context,
     presentation_id: str,
     page_object_id: str,
-    user_google_email: Optional[str] = None
-):
+    user_google_email: Optional[str] = None,
+    verbose: bool = False
+) -> GetPageResponse:
     """
-    <description>Retrieves detailed information about a specific slide including all page elements (text boxes, shapes, images, tables) and their properties. Shows slide content structure.</description>
+    <description>Retrieves information about a specific slide: its type and element count. With verbose=True, also lists all page elements (text boxes, shapes, images, tables) and their properties. Shows slide content structure.</description>
     
     <use_case>Analyzing slide content before modification, understanding element layout for automation, or extracting specific slide information for processing.</use_case>
     
@@ -229,50 +403,84 @@ async def get_page(
         user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
         presentation_id (str): The ID of the presentation.
         page_object_id (str): The object ID of the page/slide to retrieve.
+        verbose (bool): Include the per-element breakdown. Defaults to False.
 
     Returns:
-        str: Details about the specific page including elements and layout.
+        GetPageResponse: Page type, element count and, with verbose, each element; str() gives a readable summary.
     """
-    logger.info(f"[get_page] Invoked. Email: '{user_google_email}', Presentation: '{presentation_id}', Page: '{page_object_id}'")
-
-    result = await asyncio.to_thread(
-        service.presentations().pages().get(
-            presentationId=presentation_id,
-            pageObjectId=page_object_id
-        ).execute
+    logger.info("[get_page] Invoked. Email: '%s', Presentation: '%s', Page: '%s'", user_google_email, presentation_id, page_object_id)
+
+    # Partial response: only the fields _summarize_page_element reads are downloaded
+    result = await slides_client.get_page(
+        service,
+        presentation_id,
+        page_object_id,
+        fields=(
+            'pageType,pageElements(objectId,shape/shapeType,table(rows,columns),line/lineType)'
+            if verbose else 'pageType,pageElements/objectId'
+        )
     )
     
-    page_type = result.get('pageType', 'Unknown')
-    page_elements = result.get('pageElements', [])
-    
-    elements_info = []
-    for element in page_elements:
-        element_id = element.get('objectId', 'Unknown')
-        if 'shape' in element:
-            shape_type = element['shape'].get('shapeType', 'Unknown')
-            elements_info.append(f"  Shape: ID {element_id}, Type: {shape_type}")
-        elif 'table' in element:
-            table = element['table']
-            rows = table.get('rows', 0)
-            cols = table.get('columns', 0)
-            elements_info.append(f"  Table: ID {element_id}, Size: {rows}x{cols}")
-        elif 'line' in element:
-            line_type = element['line'].get('lineType', 'Unknown')
-            elements_info.append(f"  Line: ID {element_id}, Type: {line_type}")
-        else:
-            elements_info.append(f"  Element: ID {element_id}, Type: Unknown")
-    
-    confirmation_message = f"""Page Details for {user_google_email}:
-- Presentation ID: {presentation_id}
-- Page ID: {page_object_id}
-- Page Type: {page_type}
-- Total Elements: {len(page_elements)}
-
-Page Elements:
-{chr(10).join(elements_info) if elements_info else '  No elements found'}"""
-    
-    logger.info(f"Page retrieved successfully for {user_google_email}")
-    return confirmation_message
+    logger.info("Page retrieved successfully for %s", user_google_email)
+    return _page_response(presentation_id, page_object_id, result, verbose)
+
+
+@server.tool
+@require_google_service("slides", "slides_read")
+@handle_http_errors("get_pages")
+async def get_pages(
+    service,
+    ctx: Context,
+    presentation_id: str,
+    page_object_ids: List[str],
+    user_google_email: Optional[str] = None,
+    verbose: bool = False
+) -> GetPagesResponse:
+    """
+    <description>Retrieves information about several slides at once: each page's type and element count, fetched concurrently. With verbose=True, also lists each page's elements like get_page.</description>
+
+    <use_case>Inspecting many slides of a deck in one call instead of calling get_page once per slide, e.g. auditing a whole presentation before bulk edits.</use_case>
+
+    <limitation>Returns element metadata but not actual text content or image data. Pages are fetched at most 20 at a time.</limitation>
+
+    <failure_cases>Fails with invalid presentation IDs or when the user lacks access. An invalid page ID is reported as that page's error without failing the others.</failure_cases>
+
+    Args:
+        user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
+        presentation_id (str): The ID of the presentation.
+        page_object_ids (List[str]): The object IDs of the pages/slides to retrieve.
+        verbose (bool): Include the per-element breakdown of each page. Defaults to False.
+
+    Returns:
+        GetPagesResponse: A GetPageResponse or ErrorResponse for each requested page, in the order given; str() gives a readable summary.
+    """
+    logger.info("[get_pages] Invoked. Email: '%s', Presentation: '%s', Pages: %s", user_google_email, presentation_id, len(page_object_ids))
+
+    fields = (
+        'pageType,pageElements(objectId,shape/shapeType,table(rows,columns),line/lineType)'
+        if verbose else 'pageType,pageElements/objectId'
+    )
+    semaphore = asyncio.Semaphore(_GET_PAGES_CONCURRENCY)
+
+    async def fetch(page_object_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await slides_client.get_page(service, presentation_id, page_object_id, fields=fields)
+
+    results = await asyncio.gather(*map(fetch, page_object_ids), return_exceptions=True)
+
+    pages = [
+        ErrorResponse(success=False, error=str(result)) if isinstance(result, Exception)
+        else _page_response(presentation_id, page_object_id, result, verbose)
+        for page_object_id, result in zip(page_object_ids, results)
+    ]
+
+    logger.info("Pages retrieved successfully for %s", user_google_email)
+    return GetPagesResponse(
+        success=not any(isinstance(page, ErrorResponse) for page in pages),
+        presentation_id=presentation_id,
+        page_ids=page_object_ids,
+        pages=pages
+    )
 
 
 @server.tool
@@ -285,7 +493,7 @@ async def get_page_thumbnail(
     page_object_id: str,
     user_google_email: Optional[str] = None,
     thumbnail_size: str = "MEDIUM"
-):
+) -> ThumbnailResponse:
     """
     <description>Generates a downloadable thumbnail image URL for a specific slide in PNG format. Creates visual preview of slide content at specified resolution (SMALL: 200px, MEDIUM: 800px, LARGE: 1600px width).</description>
     
@@ -293,7 +501,7 @@ async def get_page_thumbnail(
     
     <limitation>Returns temporary URLs that expire after some time. Cannot generate thumbnails for slides with restricted content or presentations without view permissions.</limitation>
     
-    <failure_cases>Fails with invalid presentation or slide IDs, slides containing restricted content the user cannot view, or when Google's thumbnail generation service is temporarily unavailable.</failure_cases>
+    <failure_cases>Fails with invalid presentation or slide IDs, an unsupported thumbnail_size, slides containing restricted content the user cannot view, or when Google's thumbnail generation service is temporarily unavailable.</failure_cases>
 
     Args:
         user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
@@ -302,30 +510,97 @@ async def get_page_thumbnail(
         thumbnail_size (str): Size of thumbnail ("LARGE", "MEDIUM", "SMALL"). Defaults to "MEDIUM".
 
     Returns:
-        str: URL to the generated thumbnail image.
+        ThumbnailResponse: URL of the generated thumbnail image; str() gives a readable summary.
     """
-    logger.info(f"[get_page_thumbnail] Invoked. Email: '{user_google_email}', Presentation: '{presentation_id}', Page: '{page_object_id}', Size: '{thumbnail_size}'")
+    logger.info("[get_page_thumbnail] Invoked. Email: '%s', Presentation: '%s', Page: '%s', Size: '%s'", user_google_email, presentation_id, page_object_id, thumbnail_size)
 
-    result = await asyncio.to_thread(
-        service.presentations().pages().getThumbnail(
-            presentationId=presentation_id,
-            pageObjectId=page_object_id,
-            thumbnailPropertiesImageSize=thumbnail_size
-        ).execute
-    )
-    
-    thumbnail_url = result.get('contentUrl', '')
-    
-    confirmation_message = f"""Thumbnail Generated for {user_google_email}:
-- Presentation ID: {presentation_id}
-- Page ID: {page_object_id}
-- Thumbnail Size: {thumbnail_size}
-- Thumbnail URL: {thumbnail_url}
+    try:
+        _validate_thumbnail_size(thumbnail_size)
+        result = await slides_client.get_page_thumbnail(
+            service, presentation_id, page_object_id, thumbnail_size
+        )
 
-You can view or download the thumbnail using the provided URL."""
-    
-    logger.info(f"Thumbnail generated successfully for {user_google_email}")
-    return confirmation_message
+        logger.info("Thumbnail generated successfully for %s", user_google_email)
+        return ThumbnailResponse(
+            success=True,
+            presentation_id=presentation_id,
+            page_id=page_object_id,
+            thumbnail_size=thumbnail_size,
+            thumbnail_url=result.get('contentUrl', '')
+        )
+
+    except ValueError as e:
+        logger.error("Validation error in get_page_thumbnail: %s", e)
+        return ErrorResponse(success=False, error=str(e))
+
+
+@server.tool
+@require_google_service("slides", "slides_read")
+@handle_http_errors("get_page_thumbnails")
+async def get_page_thumbnails(
+    service,
+    ctx: Context,
+    presentation_id: str,
+    page_object_ids: List[str],
+    user_google_email: Optional[str] = None,
+    thumbnail_size: str = "MEDIUM"
+) -> ThumbnailsResponse:
+    """
+    <description>Generates thumbnail image URLs for several slides at once, fetched concurrently. Same sizes as get_page_thumbnail (SMALL: 200px, MEDIUM: 800px, LARGE: 1600px width).</description>
+
+    <use_case>Building a preview of a whole deck or a slide picker in one call instead of calling get_page_thumbnail once per slide.</use_case>
+
+    <limitation>Returns temporary URLs that expire after some time. Thumbnails are generated at most 20 at a time, and Google rate-limits thumbnail generation more tightly than other reads.</limitation>
+
+    <failure_cases>Returns an error for an unsupported thumbnail_size before any request is made. Fails with invalid presentation IDs. An invalid page ID is reported as that page's error without failing the others.</failure_cases>
+
+    Args:
+        user_google_email (Optional[str]): The user's Google email address. If not provided, will be automatically detected.
+        presentation_id (str): The ID of the presentation.
+        page_object_ids (List[str]): The object IDs of the pages/slides.
+        thumbnail_size (str): Size of thumbnails ("LARGE", "MEDIUM", "SMALL"). Defaults to "MEDIUM".
+
+    Returns:
+        ThumbnailsResponse: A ThumbnailResponse or ErrorResponse for each requested page, in the order given; str() gives a readable summary.
+    """
+    logger.info("[get_page_thumbnails] Invoked. Email: '%s', Presentation: '%s', Pages: %s, Size: '%s'", user_google_email, presentation_id, len(page_object_ids), thumbnail_size)
+
+    try:
+        _validate_thumbnail_size(thumbnail_size)
+    except ValueError as e:
+        logger.error("Validation error in get_page_thumbnails: %s", e)
+        return ErrorResponse(success=False, error=str(e))
+
+    semaphore = asyncio.Semaphore(_GET_PAGES_CONCURRENCY)
+
+    async def fetch(page_object_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await slides_client.get_page_thumbnail(
+                service, presentation_id, page_object_id, thumbnail_size
+            )
+
+    results = await asyncio.gather(*map(fetch, page_object_ids), return_exceptions=True)
+
+    thumbnails = [
+        ErrorResponse(success=False, error=str(result)) if isinstance(result, Exception)
+        else ThumbnailResponse(
+            success=True,
+            presentation_id=presentation_id,
+            page_id=page_object_id,
+            thumbnail_size=thumbnail_size,
+            thumbnail_url=result.get('contentUrl', '')
+        )
+        for page_object_id, result in zip(page_object_ids, results)
+    ]
+
+    logger.info("Thumbnails generated successfully for %s", user_google_email)
+    return ThumbnailsResponse(
+        success=not any(isinstance(thumbnail, ErrorResponse) for thumbnail in thumbnails),
+        presentation_id=presentation_id,
+        thumbnail_size=thumbnail_size,
+        page_ids=page_object_ids,
+        thumbnails=thumbnails
+    )
 
 
 @server.tool
@@ -357,36 +632,20 @@ async def add_slide(
     Returns:
         str: JSON with slide_id and presentation_id
     """
-    logger.info(f"[add_slide] Invoked. URL: '{presentation_url}', Layout: '{layout}'")
+    logger.info("[add_slide] Invoked. URL: '%s', Layout: '%s'", presentation_url, layout)
 
     try:
-        presentation_id = await extract_presentation_id_from_url(presentation_url)
+        presentation_id = extract_presentation_id_from_url(presentation_url)
 
         # Generate slide ID if not provided
         if not slide_id:
             slide_id = generate_object_id('slide')
 
-        # Create the slide request
-        requests = [
-            {
-                'createSlide': {
-                    'objectId': slide_id,
-                    'slideLayoutReference': {
-                        'predefinedLayout': layout
-                    }
-                }
-            }
-        ]
-
-        # Execute the batch update
-        await asyncio.to_thread(
-            service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={'requests': requests}
-            ).execute
-        )
+        # Create the slide, batched with any open SlideBuilder
+        async with _slide_builder(service, presentation_id) as builder:
+            builder.add_slide(slide_id, layout)
 
-        logger.info(f"Slide added successfully: {slide_id}")
+        logger.info("Slide added successfully: %s", slide_id)
         return AddSlideResponse(
             success=True,
             slide_id=slide_id,
@@ -395,7 +654,7 @@ async def add_slide(
         )
 
     except ValueError as e:
-        logger.error(f"Validation error in add_slide: {e}")
+        logger.error("Validation error in add_slide: %s", e)
         return ErrorResponse(success=False, error=str(e))
 
 
@@ -436,37 +695,18 @@ async def add_title(
     Returns:
         str: JSON with title_object_id and slide_id
     """
-    logger.info(f"[add_title] Invoked. URL: '{presentation_url}', Text: '{text[:50]}...', Page: '{page_id}'")
+    logger.info("[add_title] Invoked. URL: '%s', Text: '%.50s...', Page: '%s'", presentation_url, text, page_id)
 
     try:
-        presentation_id = await extract_presentation_id_from_url(presentation_url)
-
-        # Resolve the slide ID
-        slide_id, total_slides = await get_slide_by_position(service, presentation_id, page_id)
-
-        # Generate title object ID
-        title_id = generate_object_id('title')
-
-        # Create requests for text box
-        requests = create_text_box_request(
-            object_id=title_id,
-            page_id=slide_id,
-            text=text,
-            size_height=size_height,
-            size_width=size_width,
-            x=x,
-            y=y
-        )
+        presentation_id = extract_presentation_id_from_url(presentation_url)
 
-        # Execute the batch update
-        await asyncio.to_thread(
-            service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={'requests': requests}
-            ).execute
+        slide_id, elements_added = await _add_slide_content(
+            service, presentation_id, page_id,
+            title=text, title_box=(size_height, size_width, x, y)
         )
+        title_id = elements_added[0]["object_id"]
 
-        logger.info(f"Title added successfully: {title_id}")
+        logger.info("Title added successfully: %s", title_id)
         return AddTitleResponse(
             success=True,
             title_object_id=title_id,
@@ -475,7 +715,7 @@ async def add_title(
         )
 
     except ValueError as e:
-        logger.error(f"Validation error in add_title: {e}")
+        logger.error("Validation error in add_title: %s", e)
         return ErrorResponse(success=False, error=str(e))
 
 
@@ -516,37 +756,18 @@ async def add_body_text(
     Returns:
         str: JSON with body_object_id and slide_id
     """
-    logger.info(f"[add_body_text] Invoked. URL: '{presentation_url}', Text: '{text[:50]}...', Page: '{page_id}'")
+    logger.info("[add_body_text] Invoked. URL: '%s', Text: '%.50s...', Page: '%s'", presentation_url, text, page_id)
 
     try:
-        presentation_id = await extract_presentation_id_from_url(presentation_url)
-
-        # Resolve the slide ID
-        slide_id, total_slides = await get_slide_by_position(service, presentation_id, page_id)
-
-        # Generate body object ID
-        body_id = generate_object_id('body')
-
-        # Create requests for text box
-        requests = create_text_box_request(
-            object_id=body_id,
-            page_id=slide_id,
-            text=text,
-            size_height=size_height,
-            size_width=size_width,
-            x=x,
-            y=y
-        )
+        presentation_id = extract_presentation_id_from_url(presentation_url)
 
-        # Execute the batch update
-        await asyncio.to_thread(
-            service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={'requests': requests}
-            ).execute
+        slide_id, elements_added = await _add_slide_content(
+            service, presentation_id, page_id,
+            body_text=text, body_box=(size_height, size_width, x, y)
         )
+        body_id = elements_added[0]["object_id"]
 
-        logger.info(f"Body text added successfully: {body_id}")
+        logger.info("Body text added successfully: %s", body_id)
         return AddBodyTextResponse(
             success=True,
             body_object_id=body_id,
@@ -555,7 +776,7 @@ async def add_body_text(
         )
 
     except ValueError as e:
-        logger.error(f"Validation error in add_body_text: {e}")
+        logger.error("Validation error in add_body_text: %s", e)
         return ErrorResponse(success=False, error=str(e))
 
 
@@ -596,37 +817,18 @@ async def add_body_image(
     Returns:
         str: JSON with image_object_id and slide_id
     """
-    logger.info(f"[add_body_image] Invoked. URL: '{presentation_url}', Image: '{image_url}', Page: '{page_id}'")
+    logger.info("[add_body_image] Invoked. URL: '%s', Image: '%s', Page: '%s'", presentation_url, image_url, page_id)
 
     try:
-        presentation_id = await extract_presentation_id_from_url(presentation_url)
-
-        # Resolve the slide ID
-        slide_id, total_slides = await get_slide_by_position(service, presentation_id, page_id)
-
-        # Generate image object ID
-        image_id = generate_object_id('image')
-
-        # Create request for image
-        request = create_image_request(
-            object_id=image_id,
-            page_id=slide_id,
-            image_url=image_url,
-            size_height=size_height,
-            size_width=size_width,
-            x=x,
-            y=y
-        )
+        presentation_id = extract_presentation_id_from_url(presentation_url)
 
-        # Execute the batch update
-        await asyncio.to_thread(
-            service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={'requests': [request]}
-            ).execute
+        slide_id, elements_added = await _add_slide_content(
+            service, presentation_id, page_id,
+            image_url=image_url, image_box=(size_height, size_width, x, y)
         )
+        image_id = elements_added[0]["object_id"]
 
-        logger.info(f"Image added successfully: {image_id}")
+        logger.info("Image added successfully: %s", image_id)
         return AddBodyImageResponse(
             success=True,
             image_object_id=image_id,
@@ -635,7 +837,93 @@ async def add_body_image(
         )
 
     except ValueError as e:
-        logger.error(f"Validation error in add_body_image: {e}")
+        logger.error("Validation error in add_body_image: %s", e)
+        return ErrorResponse(success=False, error=str(e))
+
+
+@server.tool
+@require_google_service("slides", "slides")
+@handle_http_errors("add_slide_content")
+async def add_slide_content(
+    service,
+    ctx: Context,
+    presentation_url: str,
+    page_id: str = "last",
+    title: Optional[str] = None,
+    title_x: int = 50,
+    title_y: int = 50,
+    title_width: int = 600,
+    title_height: int = 50,
+    body_text: Optional[str] = None,
+    body_x: int = 50,
+    body_y: int = 100,
+    body_width: int = 600,
+    body_height: int = 200,
+    image_url: Optional[str] = None,
+    image_x: int = 100,
+    image_y: int = 50,
+    image_width: int = 200,
+    image_height: int = 150,
+    user_google_email: Optional[str] = None
+) -> AddSlideContentResponse:
+    """
+    <description>Adds any combination of title, body text, and image to an existing slide in a single update. Equivalent to calling add_title, add_body_text, and add_body_image on the same slide, with one slide lookup and one API call instead of three of each.</description>
+
+    <use_case>Filling in a slide that already exists, such as the last slide added or a slide from a template, when it needs more than one element.</use_case>
+
+    <limitation>Requires valid slide ID or "first"/"last" position. At least one of title, body_text, or image_url must be provided. Elements are positioned independently with flat parameters.</limitation>
+
+    <failure_cases>Fails when page_id doesn't exist, when presentation has no slides, when image URL is invalid or inaccessible, or when user lacks edit permissions. The update is atomic: if any element fails, none are added.</failure_cases>
+
+    Args:
+        presentation_url (str): The URL or ID of the presentation
+        page_id (str): Slide ID, "first", or "last". Defaults to "last"
+        title (Optional[str]): Title text to add. If None, no title is added
+        title_x (int): Title X position in points. Defaults to 50
+        title_y (int): Title Y position in points. Defaults to 50
+        title_width (int): Title width in points. Defaults to 600
+        title_height (int): Title height in points. Defaults to 50
+        body_text (Optional[str]): Body text to add. If None, no body is added
+        body_x (int): Body X position in points. Defaults to 50
+        body_y (int): Body Y position in points. Defaults to 100
+        body_width (int): Body width in points. Defaults to 600
+        body_height (int): Body height in points. Defaults to 200
+        image_url (Optional[str]): Image URL to add. If None, no image is added
+        image_x (int): Image X position in points. Defaults to 100
+        image_y (int): Image Y position in points. Defaults to 50
+        image_width (int): Image width in points. Defaults to 200
+        image_height (int): Image height in points. Defaults to 150
+        user_google_email (Optional[str]): The user's Google email address
+
+    Returns:
+        AddSlideContentResponse: JSON with slide_id, presentation_id, and list of elements_added
+    """
+    logger.info("[add_slide_content] Invoked. URL: '%s', Page: '%s'", presentation_url, page_id)
+    logger.info("  Title: %s, Body: %s, Image: %s", bool(title), bool(body_text), bool(image_url))
+
+    try:
+        if not (title or body_text or image_url):
+            raise ValueError("Provide at least one of title, body_text, or image_url")
+
+        presentation_id = extract_presentation_id_from_url(presentation_url)
+
+        slide_id, elements_added = await _add_slide_content(
+            service, presentation_id, page_id,
+            title=title or None, title_box=(title_height, title_width, title_x, title_y),
+            body_text=body_text or None, body_box=(body_height, body_width, body_x, body_y),
+            image_url=image_url or None, image_box=(image_height, image_width, image_x, image_y)
+        )
+
+        logger.info("Slide content added successfully. Slide: %s, Elements: %s", slide_id, len(elements_added))
+        return AddSlideContentResponse(
+            success=True,
+            slide_id=slide_id,
+            presentation_id=presentation_id,
+            elements_added=elements_added
+        )
+
+    except ValueError as e:
+        logger.error("Validation error in add_slide_content: %s", e)
         return ErrorResponse(success=False, error=str(e))
 
 
@@ -696,92 +984,83 @@ async def add_page_with_content(
     Returns:
         AddPageWithContentResponse: JSON with slide_id, presentation_id, layout, and list of elements_added
     """
-    logger.info(f"[add_page_with_content] Invoked. URL: '{presentation_url}', Layout: '{layout}'")
-    logger.info(f"  Title: {bool(title)}, Body: {bool(body_text)}, Image: {bool(image_url)}")
+    logger.info("[add_page_with_content] Invoked. URL: '%s', Layout: '%s'", presentation_url, layout)
+    logger.info("  Title: %s, Body: %s, Image: %s", bool(title), bool(body_text), bool(image_url))
 
     try:
-        presentation_id = await extract_presentation_id_from_url(presentation_url)
+        presentation_id = extract_presentation_id_from_url(presentation_url)
+
+        # Fail on a bad image URL before creating anything
+        if image_url:
+            await validate_image_url(image_url)
+
+        # A whitespace-only body would only produce an empty text box
+        has_body = bool(body_text) and not body_text.isspace()
 
         # Generate IDs for all elements
-        slide_id = generate_object_id('slide')
-        title_id = generate_object_id('title') if title else None
-        body_id = generate_object_id('body') if body_text else None
-        image_id = generate_object_id('image') if image_url else None
+        slide_id, title_id, body_id, image_id = generate_object_ids([
+            'slide',
+            'title' if title else None,
+            'body' if has_body else None,
+            'image' if image_url else None
+        ])
 
-        # Build requests array
-        requests = []
         elements_added = []
 
-        # Step 1: Create slide
-        requests.append({
-            'createSlide': {
-                'objectId': slide_id,
-                'slideLayoutReference': {
-                    'predefinedLayout': layout
-                }
-            }
-        })
-
-        # Step 2: Add title if provided
-        if title:
-            title_requests = create_text_box_request(
-                object_id=title_id,
-                page_id=slide_id,
-                text=title,
-                size_height=title_height,
-                size_width=title_width,
-                x=title_x,
-                y=title_y
-            )
-            requests.extend(title_requests)
-            elements_added.append({
-                "type": "title",
-                "object_id": title_id
-            })
-
-        # Step 3: Add body text if provided
-        if body_text:
-            body_requests = create_text_box_request(
-                object_id=body_id,
-                page_id=slide_id,
-                text=body_text,
-                size_height=body_height,
-                size_width=body_width,
-                x=body_x,
-                y=body_y
-            )
-            requests.extend(body_requests)
-            elements_added.append({
-                "type": "body_text",
-                "object_id": body_id
-            })
+        # All elements go out in a single batch update, together with any open SlideBuilder
+        async with _slide_builder(service, presentation_id) as builder:
+            # Step 1: Create slide
+            builder.add_slide(slide_id, layout)
+
+            # Step 2: Add title if provided
+            if title:
+                builder.add_text_box(
+                    object_id=title_id,
+                    page_id=slide_id,
+                    text=title,
+                    size_height=title_height,
+                    size_width=title_width,
+                    x=title_x,
+                    y=title_y
+                )
+                elements_added.append({
+                    "type": "title",
+                    "object_id": title_id
+                })
 
-        # Step 4: Add image if provided
-        if image_url:
-            image_request = create_image_request(
-                object_id=image_id,
-                page_id=slide_id,
-                image_url=image_url,
-                size_height=image_height,
-                size_width=image_width,
-                x=image_x,
-                y=image_y
-            )
-            requests.append(image_request)
-            elements_added.append({
-                "type": "image",
-                "object_id": image_id
-            })
-
-        # Execute all requests in a single batch update
-        await asyncio.to_thread(
-            service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={'requests': requests}
-            ).execute
-        )
+            # Step 3: Add body text if provided
+            if has_body:
+                builder.add_text_box(
+                    object_id=body_id,
+                    page_id=slide_id,
+                    text=body_text,
+                    size_height=body_height,
+                    size_width=body_width,
+                    x=body_x,
+                    y=body_y
+                )
+                elements_added.append({
+                    "type": "body_text",
+                    "object_id": body_id
+                })
 
-        logger.info(f"Page with content created successfully. Slide: {slide_id}, Elements: {len(elements_added)}")
+            # Step 4: Add image if provided
+            if image_url:
+                builder.add_image(
+                    object_id=image_id,
+                    page_id=slide_id,
+                    image_url=image_url,
+                    size_height=image_height,
+                    size_width=image_width,
+                    x=image_x,
+                    y=image_y
+                )
+                elements_added.append({
+                    "type": "image",
+                    "object_id": image_id
+                })
+
+        logger.info("Page with content created successfully. Slide: %s, Elements: %s", slide_id, len(elements_added))
         return AddPageWithContentResponse(
             success=True,
             slide_id=slide_id,
@@ -791,10 +1070,268 @@ async def add_page_with_content(
         )
 
     except ValueError as e:
-        logger.error(f"Validation error in add_page_with_content: {e}")
+        logger.error("Validation error in add_page_with_content: %s", e)
         return ErrorResponse(success=False, error=str(e))
 
 
+@server.tool
+@require_google_service("slides", "slides")
+@handle_http_errors("add_many")
+async def add_many(
+    service,
+    ctx: Context,
+    presentation_url: str,
+    requests_per_slide: List[List[Dict[str, Any]]],
+    user_google_email: Optional[str] = None
+) -> AddManyResponse:
+    """
+    <description>Applies several independent groups of Slides API requests to one presentation concurrently. Each group is sent as its own batch update, and all batches are in flight at the same time.</description>
+
+    <use_case>Filling many existing slides at once, e.g. adding images or text boxes to different slides, where each slide's changes don't depend on the others.</use_case>
+
+    <limitation>Each group is atomic on its own, but groups are not atomic together and may be applied in any order. Requests in one group must not depend on objects created by another group. Limited to 500 requests per group.</limitation>
+
+    <failure_cases>Fails with invalid presentation URLs or when user lacks edit permissions. A group with an invalid request fails on its own; the other groups are still applied and the failure is reported in errors.</failure_cases>
+
+    Args:
+        presentation_url (str): The URL or ID of the presentation
+        requests_per_slide (List[List[Dict[str, Any]]]): Groups of update requests, one batch update per group
+        user_google_email (Optional[str]): The user's Google email address
+
+    Returns:
+        AddManyResponse: JSON with batches_sent, batches_failed, and per-batch errors
+    """
+    presentation_id = extract_presentation_id_from_url(presentation_url)
+    # Keep each group's position so errors point at the caller's index
+    groups = [(i, requests) for i, requests in enumerate(requests_per_slide, 1) if requests]
+    logger.info("[add_many] Invoked. URL: '%s', Batches: %s", presentation_url, len(groups))
+
+    results = await asyncio.gather(
+        *(slides_client.batch_update(service, presentation_id, requests) for _, requests in groups),
+        return_exceptions=True
+    )
+    invalidate_slide_cache(presentation_id)
+
+    errors = [
+        f"Batch {i}: {result}"
+        for (i, _), result in zip(groups, results)
+        if isinstance(result, Exception)
+    ]
+    for error in errors:
+        logger.warning("[add_many] %s", error)
+
+    logger.info("[add_many] Sent %s batch(es), %s failed", len(groups), len(errors))
+    return AddManyResponse(
+        success=not errors,
+        presentation_id=presentation_id,
+        batches_sent=len(groups),
+        batches_failed=len(errors),
+        errors=errors
+    )
+
+
+@server.tool
+@require_google_service("slides", "slides")
+@handle_http_errors("bulk_apply")
+async def bulk_apply(
+    service,
+    ctx: Context,
+    requests_by_presentation: Dict[str, List[Dict[str, Any]]],
+    user_google_email: Optional[str] = None
+) -> BulkApplyResponse:
+    """
+    <description>Applies a batch of Slides API requests to each of several presentations concurrently. Each presentation gets its own batch update, and all of them are in flight at the same time.</description>
+
+    <use_case>Stamping the same change into many decks, e.g. replacing a footer or logo across a set of presentations, or updating several independent presentations in one call.</use_case>
+
+    <limitation>Each presentation's batch is atomic on its own, but presentations are not updated atomically together. Limited to 500 requests per presentation. Calls are paced automatically if the API starts throttling.</limitation>
+
+    <failure_cases>Fails when user lacks edit permissions on every presentation. A presentation with an invalid request or ID fails on its own; the others are still updated and the failure is reported in errors.</failure_cases>
+
+    Args:
+        requests_by_presentation (Dict[str, List[Dict[str, Any]]]): Update requests keyed by presentation URL or ID
+        user_google_email (Optional[str]): The user's Google email address
+
+    Returns:
+        BulkApplyResponse: JSON with presentations_updated, presentations_failed, and per-presentation errors
+    """
+    batches = [
+        (extract_presentation_id_from_url(presentation_url), requests)
+        for presentation_url, requests in requests_by_presentation.items()
+        if requests
+    ]
+    logger.info("[bulk_apply] Invoked. Presentations: %s", len(batches))
+
+    results = await asyncio.gather(
+        *(slides_client.batch_update(service, presentation_id, requests) for presentation_id, requests in batches),
+        return_exceptions=True
+    )
+
+    updated = []
+    errors = []
+    for (presentation_id, requests), result in zip(batches, results):
+        if isinstance(result, Exception):
+            errors.append(f"Presentation {presentation_id}: {result}")
+            logger.warning("[bulk_apply] %s", errors[-1])
+        else:
+            record_slide_changes(presentation_id, requests, result.get('replies', []))
+            updated.append(presentation_id)
+
+    logger.info("[bulk_apply] Updated %s presentation(s), %s failed", len(updated), len(errors))
+    return BulkApplyResponse(
+        success=not errors,
+        presentations_updated=updated,
+        presentations_failed=len(errors),
+        errors=errors
+    )
+
+
+def _markdown_title_requests(object_id: str, slide_id: str, title: str) -> List[Dict[str, Any]]:
+    return create_text_box_request(object_id, slide_id, title, 60, 640, 30, 20)
+
+
+def _markdown_body_requests(object_id: str, slide_id: str, body_text: str) -> List[Dict[str, Any]]:
+    return create_text_box_request(object_id, slide_id, body_text, 300, 640, 30, 100)
+
+
+def _markdown_image_requests(object_id: str, slide_id: str, image_url: str) -> List[Dict[str, Any]]:
+    return [create_image_request(object_id, slide_id, image_url, 200, 250, 400, 120)]
+
+
+# ID prefix and request builder for each element a markdown slide can have, in
+# the order of its (title, body text, image URL) contents
+_MARKDOWN_ELEMENTS = (
+    ('title', _markdown_title_requests),
+    ('body', _markdown_body_requests),
+    ('image', _markdown_image_requests)
+)
+
+# The elements to build for each (has title, has body, has image) combination
+_MARKDOWN_SLIDE_KINDS = {
+    kind: tuple(element for element, present in zip(_MARKDOWN_ELEMENTS, kind) if present)
+    for kind in itertools.product((False, True), repeat=3)
+}
+
+
+async def _check_slide_images(slides_data, warnings: List[str]) -> List[Optional[str]]:
+    """
+    Check every distinct image URL in a deck concurrently.
+
+    Only the first _MAX_IMAGE_PROBES URLs are probed over the network (when
+    SLIDES_CHECK_IMAGE_URLS is set), so one deck can't make the server
+    contact an unbounded number of hosts.
+
+    Returns:
+        Each slide's image URL, or None where the slide has no image or its
+        image failed the check (a warning is recorded instead)
+    """
+    async def check(image_url: str, probe: bool) -> Optional[ValueError]:
+        try:
+            await validate_image_url(image_url, probe=probe)
+        except ValueError as e:
+            return e
+        return None
+
+    image_urls = list(dict.fromkeys(
+        slide_data.image_url for slide_data in slides_data if slide_data.image_url
+    ))
+    errors = dict(zip(image_urls, await asyncio.gather(*(
+        check(url, index < _MAX_IMAGE_PROBES) for index, url in enumerate(image_urls)
+    ))))
+
+    checked = []
+    for slide_data in slides_data:
+        error = errors.get(slide_data.image_url)
+        if error is not None:
+            logger.warning("Skipping image on slide '%s': %s", slide_data.title, error)
+            warnings.append(f"Skipped image on slide '{slide_data.title}': {str(error)}")
+            checked.append(None)
+        else:
+            checked.append(slide_data.image_url)
+    return checked
+
+
+def _split_deck(slide_batches):
+    """Group consecutive slides so each group's requests fit in one batchUpdate."""
+    chunk, chunk_size = [], 0
+    for entry in slide_batches:
+        size = 1 + len(entry[2])  # createSlide plus the slide's element requests
+        if chunk and chunk_size + size > MAX_BATCH_REQUESTS:
+            yield chunk
+            chunk, chunk_size = [], 0
+        chunk.append(entry)
+        chunk_size += size
+    if chunk:
+        yield chunk
+
+
+async def _create_deck_chunk(
+    service,
+    presentation_id: str,
+    chunk,
+    warnings: List[str],
+    existing_slide_id: Optional[str] = None
+) -> int:
+    """
+    Create a group of slides with their elements in a single batchUpdate.
+
+    The slide with existing_slide_id, if any, is already in the presentation
+    and only gets its element requests.
+
+    If the batch is rejected, falls back to per-slide batches, at most
+    SLIDES_MAX_CONCURRENCY (default 16) at a time, and records a warning for
+    each slide that still fails.
+
+    Returns:
+        The number of elements created
+    """
+    # Flatten the chunk into one list instead of growing it slide by slide
+    deck = SlidesRequestBatcher()
+    deck.extend(list(itertools.chain.from_iterable(
+        (create_slide_request(slide_id), *batch.requests) if slide_id != existing_slide_id else batch.requests
+        for _, slide_id, batch, _ in chunk
+    )))
+
+    try:
+        await deck.flush(service, presentation_id)
+        logger.info("Created %s slides in one batch update", len(chunk))
+        return sum(elements_count for _, _, _, elements_count in chunk)
+
+    except Exception as e:
+        # A batch is applied atomically, so nothing was created. Create the empty
+        # slides first, then fill them concurrently so one bad slide (e.g. an
+        # unreachable image URL) only costs itself.
+        logger.warning("Deck batch update failed, retrying per slide: %s", e)
+
+    slides_batch = SlidesRequestBatcher()
+    slides_batch.extend([
+        create_slide_request(slide_id) for _, slide_id, _, _ in chunk if slide_id != existing_slide_id
+    ])
+    await slides_batch.flush(service, presentation_id)
+
+    semaphore = asyncio.Semaphore(_SLIDE_FALLBACK_CONCURRENCY)
+
+    async def fill(batch: SlidesRequestBatcher) -> Dict[str, Any]:
+        async with semaphore:
+            return await batch.flush(service, presentation_id)
+
+    results = await asyncio.gather(
+        *(fill(batch) for _, _, batch, _ in chunk),
+        return_exceptions=True
+    )
+    total_elements = 0
+    created_titles = []
+    for (slide_data, _, _, elements_count), result in zip(chunk, results):
+        if isinstance(result, Exception):
+            logger.error("Error creating slide '%s': %s", slide_data.title, result)
+            warnings.append(f"Error creating slide '{slide_data.title}': {str(result)}")
+        else:
+            total_elements += elements_count
+            created_titles.append(slide_data.title)
+    logger.info("Filled %s of %s slides with %s elements: %s", len(created_titles), len(chunk), total_elements, created_titles)
+    return total_elements
+
+
 @server.tool
 @require_google_service("slides", "slides")
 @handle_http_errors("create_presentation_from_markdown")
@@ -812,7 +1349,7 @@ async def create_presentation_from_markdown(
 
     <limitation>Requires H1 heading for presentation title (or provide presentation_title parameter). Only first image per slide is used. Tables are not supported. Code blocks converted to plain monospace text. H3+ headings become body text.</limitation>
 
-    <failure_cases>Fails if markdown has no H1 and no presentation_title provided. Fails with invalid image URLs. Fails if user lacks Slides creation permissions. Returns warnings for unsupported elements (multiple images, tables).</failure_cases>
+    <failure_cases>Fails if markdown has no H1 and no presentation_title provided. Images whose URLs are unreachable or return 404 are skipped with a warning. Fails if user lacks Slides creation permissions. Returns warnings for unsupported elements (multiple images, tables).</failure_cases>
 
     Args:
         markdown_content (str): Markdown text content to convert
@@ -834,11 +1371,13 @@ async def create_presentation_from_markdown(
     Returns:
         MarkdownToSlidesResponse: JSON with presentation details, slides created, and warnings
     """
-    logger.info(f"[create_presentation_from_markdown] Invoked. Content length: {len(markdown_content)}")
+    logger.info("[create_presentation_from_markdown] Invoked. Content length: %s", len(markdown_content))
 
     try:
-        # Parse markdown
-        parsed_data = parse_markdown_to_slides(markdown_content)
+        # Parse markdown; repeats come from the cache, new documents parse off the event loop
+        parsed_data = get_cached_markdown_parse(markdown_content)
+        if parsed_data is None:
+            parsed_data = await slides_client.run_blocking(parse_markdown_to_slides_cached, markdown_content)
 
         # Get title
         title = presentation_title or parsed_data.get("presentation_title")
@@ -857,104 +1396,73 @@ async def create_presentation_from_markdown(
                 error="No slides generated. Markdown must have at least one ## H2 heading to create slides."
             )
 
-        logger.info(f"Parsed markdown: title='{title}', slides={len(slides_data)}, warnings={len(warnings)}")
+        logger.info("Parsed markdown: title='%s', slides=%s, warnings=%s", title, len(slides_data), len(warnings))
 
-        # Create presentation directly using API
+        # Create presentation directly using API, checking image URLs meanwhile
         body = {'title': title}
-        result = await asyncio.to_thread(
-            service.presentations().create(body=body).execute
+        result, image_urls = await asyncio.gather(
+            slides_client.create_presentation(service, body),
+            _check_slide_images(slides_data, warnings)
         )
 
         presentation_id = result.get('presentationId')
         presentation_url = f"https://docs.google.com/presentation/d/{presentation_id}/edit"
 
-        logger.info(f"Created presentation: {presentation_id}")
+        logger.info("Created presentation: %s", presentation_id)
 
-        # Create slides using add_page_with_content (directly build requests)
-        total_elements = 0
-        for slide_data in slides_data:
-            try:
-                # Extract presentation ID
-                pres_id = await extract_presentation_id_from_url(presentation_url)
-
-                # Generate IDs
-                slide_id = generate_object_id('slide')
-                title_id = generate_object_id('title') if slide_data.title else None
-                body_id = generate_object_id('body') if slide_data.body_text else None
-                image_id = generate_object_id('image') if slide_data.image_url else None
-
-                # Build requests
-                requests = []
-                elements_count = 0
-
-                # Create slide
-                requests.append({
-                    'createSlide': {
-                        'objectId': slide_id,
-                        'slideLayoutReference': {
-                            'predefinedLayout': 'BLANK'
-                        }
-                    }
-                })
+        # Join each body once; SlideData.body_text builds a new string per access
+        body_texts = [slide_data.body_text.strip() for slide_data in slides_data]
 
-                # Add title if exists
-                if slide_data.title:
-                    title_requests = create_text_box_request(
-                        object_id=title_id,
-                        page_id=slide_id,
-                        text=slide_data.title,
-                        size_height=60,
-                        size_width=640,
-                        x=30,
-                        y=20
-                    )
-                    requests.extend(title_requests)
-                    elements_count += 1
-
-                # Add body text if exists
-                if slide_data.body_text and slide_data.body_text.strip():
-                    body_requests = create_text_box_request(
-                        object_id=body_id,
-                        page_id=slide_id,
-                        text=slide_data.body_text.strip(),
-                        size_height=300,
-                        size_width=640,
-                        x=30,
-                        y=100
-                    )
-                    requests.extend(body_requests)
-                    elements_count += 1
-
-                # Add image if exists
-                if slide_data.image_url:
-                    image_request = create_image_request(
-                        object_id=image_id,
-                        page_id=slide_id,
-                        image_url=slide_data.image_url,
-                        size_height=200,
-                        size_width=250,
-                        x=400,
-                        y=120
-                    )
-                    requests.append(image_request)
-                    elements_count += 1
-
-                # Execute batch update
-                await asyncio.to_thread(
-                    service.presentations().batchUpdate(
-                        presentationId=pres_id,
-                        body={'requests': requests}
-                    ).execute
-                )
-
-                total_elements += elements_count
-                logger.info(f"Created slide '{slide_data.title}' with {elements_count} elements")
+        # Each slide's (title, body text, image URL); slides skip the elements they lack
+        slide_contents = [
+            (slide_data.title, body_text, image_url)
+            for slide_data, body_text, image_url in zip(slides_data, body_texts, image_urls)
+        ]
 
-            except Exception as e:
-                logger.error(f"Error creating slide '{slide_data.title}': {e}")
-                warnings.append(f"Error creating slide '{slide_data.title}': {str(e)}")
+        # Pick each slide's element builders once
+        slide_kinds = [_MARKDOWN_SLIDE_KINDS[tuple(map(bool, contents))] for contents in slide_contents]
+
+        # The new presentation already has one slide; the first markdown slide reuses it
+        # after clearing its placeholders, instead of leaving it blank at the front
+        default_slides = result.get('slides') or []
+        reused_slide_id = default_slides[0]['objectId'] if default_slides else None
+
+        # Number every object in the deck in one pass
+        object_ids = iter(generate_object_ids([
+            prefix
+            for index, elements in enumerate(slide_kinds)
+            for prefix in (
+                'slide' if index or not reused_slide_id else None,
+                *(prefix for prefix, _ in elements)
+            )
+        ]))
+
+        # Build every slide's element requests up front, one batch per slide
+        slide_batches = []
+        for slide_data, contents, elements in zip(slides_data, slide_contents, slide_kinds):
+            slide_id = next(object_ids) or reused_slide_id
+            batch = SlidesRequestBatcher()
+            if slide_id == reused_slide_id:
+                batch.extend([
+                    {'deleteObject': {'objectId': element['objectId']}}
+                    for element in default_slides[0].get('pageElements', [])
+                ])
+            # object_ids goes last, so zip stops before taking an ID it won't use
+            for (_, build), content, object_id in zip(elements, filter(None, contents), object_ids):
+                batch.extend(build(object_id, slide_id, content))
+            slide_batches.append((slide_data, slide_id, batch, len(elements)))
+
+        # Send the deck in as few batchUpdates as the per-batch request limit allows,
+        # reporting progress per batch so clients can follow large decks
+        total_elements = 0
+        slides_done = 0
+        for chunk in _split_deck(slide_batches):
+            total_elements += await _create_deck_chunk(service, presentation_id, chunk, warnings, reused_slide_id)
+            slides_done += len(chunk)
+            if ctx is not None:
+                await ctx.report_progress(slides_done, len(slides_data))
 
-        logger.info(f"Presentation created successfully: {len(slides_data)} slides, {total_elements} elements")
+        logger.info("Presentation created successfully: %s slides, %s elements", len(slides_data), total_elements)
 
         return MarkdownToSlidesResponse(
             success=True,
@@ -967,10 +1475,10 @@ async def create_presentation_from_markdown(
         )
 
     except ValueError as e:
-        logger.error(f"Validation error in create_presentation_from_markdown: {e}")
+        logger.error("Validation error in create_presentation_from_markdown: %s", e)
         return ErrorResponse(success=False, error=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error in create_presentation_from_markdown: {e}")
+        logger.error("Unexpected error in create_presentation_from_markdown: %s", e)
         return ErrorResponse(success=False, error=f"Unexpected error: {str(e)}")
 
 
@@ -0,0 +1,106 @@
+"""
+Shared MCP client session for the live Slides test scripts
+
+The live scripts talk to a running MCP server at ENDPOINT. Opening the
+streamable HTTP transport and running the MCP initialize handshake costs a
+few round trips, so scripts accept an already-open session and
+run_live_tests.py runs them all over a single one.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Coroutine, Dict, Optional, Type, TypeVar
+
+# The mcp client stack takes about half a second to import, so it is only
+# loaded once a session is opened; see skip_without_credentials()
+if TYPE_CHECKING:
+    from mcp import ClientSession
+    from pydantic import BaseModel
+
+# Load environment variables
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    print("⚠️  python-dotenv not installed, using system environment variables only")
+
+# Test configuration
+ENDPOINT = "http://127.0.0.1:3333"
+IMAGE_URL = "https://static-cdn.toi-media.com/www/uploads/2014/07/gal-gadot.jpg"
+# Stamped once per process, so every presentation a run creates carries the same ID
+RUN_ID = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+ResponseT = TypeVar("ResponseT", bound="BaseModel")
+
+# Per-case details are logged at INFO; set VERBOSE=1 to print them
+log = logging.getLogger("slides_live_tests")
+log.setLevel(logging.INFO if os.getenv("VERBOSE") else logging.WARNING)
+log.addHandler(logging.StreamHandler(sys.stdout))
+log.propagate = False
+
+
+@functools.cache
+def oauth_headers() -> Dict[str, Optional[str]]:
+    """
+    OAuth headers the MCP server reads the test user's credentials from.
+
+    Read from the environment once per process. The server caches the built
+    service per credential set, so reusing the same headers on every call
+    also reuses its access token until it expires.
+    """
+    return {
+        "GOOGLE_OAUTH_REFRESH_TOKEN": os.getenv("TEST_GOOGLE_OAUTH_REFRESH_TOKEN"),
+        "GOOGLE_OAUTH_CLIENT_ID": os.getenv("TEST_GOOGLE_OAUTH_CLIENT_ID"),
+        "GOOGLE_OAUTH_CLIENT_SECRET": os.getenv("TEST_GOOGLE_OAUTH_CLIENT_SECRET"),
+    }
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a script's main coroutine like asyncio.run, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+
+def skip_without_credentials() -> None:
+    """Under pytest, skip the calling test module at collection if the OAuth credentials aren't configured."""
+    if "pytest" in sys.modules and not all(oauth_headers().values()):
+        import pytest
+        pytest.skip("Google OAuth creds not configured", allow_module_level=True)
+
+
+@asynccontextmanager
+async def open_session() -> AsyncIterator["ClientSession"]:
+    """Connect to the MCP server and yield an initialized session."""
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    async with streamablehttp_client(url=f"{ENDPOINT}/mcp", headers=oauth_headers()) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            yield session
+
+
+def error_text(result: Any) -> str:
+    """The text of a failed tool result, for reporting."""
+    return result.content[0].text if result.content else 'Unknown error'
+
+
+async def call_tool(
+    session: "ClientSession",
+    tool: str,
+    args: Dict[str, Any],
+    response_model: Type[ResponseT]
+) -> ResponseT:
+    """Call a tool that is expected to succeed and decode its result into response_model."""
+    result = await session.call_tool(tool, args)
+    assert not result.isError, f"{tool} failed: {error_text(result)}"
+    return response_model.model_validate_json(result.content[0].text)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Run the live Slides MCP test scripts over one shared session
+
+Connects to the MCP server once and runs each script's test against that
+session, instead of every script opening its own connection.
+
+Usage:
+    python tests/slides/run_live_tests.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from mcp_session import oauth_headers, open_session, run
+from test_add_page_with_content import test_add_page_with_content
+from test_markdown_to_slides import test_markdown_to_slides
+
+LIVE_TESTS = (
+    test_add_page_with_content,
+    test_markdown_to_slides,
+)
+
+
+async def run_live_tests():
+    """Run every live test on a single MCP session; True if all passed"""
+    if not all(oauth_headers().values()):
+        print("❌ Missing required environment variables")
+        return False
+
+    results = {}
+    async with open_session() as session:
+        for test in LIVE_TESTS:
+            try:
+                results[test.__name__] = await test(session)
+            except AssertionError as e:
+                print(f"❌ {test.__name__}: {e}")
+                results[test.__name__] = False
+
+    print("\n📊 Live test results:")
+    for name, passed in results.items():
+        print(f"   {'✅' if passed else '❌'} {name}")
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    success = run(run_live_tests())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the image URL check in gslides.slides_service
+
+Only uses IP literals and rejected URLs, so nothing is fetched.
+
+Usage:
+    python tests/slides/test_image_url_check.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from gslides.slides_service import _require_public_host, validate_image_url
+
+
+def _error(coro):
+    try:
+        asyncio.run(coro)
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+def test_non_http_schemes_are_rejected():
+    for url in ("file:///etc/passwd", "ftp://example.com/a.png", "gopher://example.com/", "example.com/a.png"):
+        assert "http or https" in _error(validate_image_url(url))
+
+
+def test_internal_hosts_are_rejected():
+    for host in ("127.0.0.1", "169.254.169.254", "10.0.0.1", "192.168.1.1", "::1", "fe80::1", "0.0.0.0"):
+        assert "public host" in _error(_require_public_host(host, f"http://{host}/a.png"))
+
+
+def test_public_hosts_are_allowed():
+    assert _error(_require_public_host("8.8.8.8", "http://8.8.8.8/a.png")) is None
+
+
+if __name__ == "__main__":
+    tests = [obj for name, obj in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n📊 {len(tests)} image URL check tests passed")
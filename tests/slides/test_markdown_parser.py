@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Markdown to Slides parser
+
+Exercises gslides.markdown_parser directly, no MCP server or credentials needed.
+
+Usage:
+    python tests/slides/test_markdown_parser.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from gslides.markdown_parser import (
+    IncrementalSlidesParser,
+    get_cached_markdown_parse,
+    iter_slides,
+    parse_markdown_to_slides,
+    parse_markdown_to_slides_cached,
+)
+
+
+DECK_MARKDOWN = """
+# Quarterly Report
+
+## Summary
+Growth was strong
+across all regions.
+
+### Highlights
+- Revenue up 25%
+- Churn down
+
+1. First
+2. Second
+
+![Chart](https://example.com/chart.png)
+![Other](https://example.com/other.png)
+
+## Code
+```python
+# not a heading
+print("hi")
+```
+
+## Links
+See [the docs](https://example.com) for **details** and `x * y`.
+"""
+
+
+def _slide(body):
+    return parse_markdown_to_slides("# T\n\n## S\n" + body)["slides"][0]
+
+
+def test_headings_split_slides():
+    result = parse_markdown_to_slides(DECK_MARKDOWN)
+    assert result["presentation_title"] == "Quarterly Report"
+    assert [s.title for s in result["slides"]] == ["Summary", "Code", "Links"]
+
+
+def test_body_blocks():
+    summary = parse_markdown_to_slides(DECK_MARKDOWN)["slides"][0]
+    assert summary.body_text == (
+        "Growth was strong\nacross all regions.\n"
+        "\n\n**Highlights**\n"
+        "\n• Revenue up 25%\n• Churn down\n"
+        "\n1. First\n2. Second\n"
+    )
+
+
+def test_first_image_wins():
+    result = parse_markdown_to_slides(DECK_MARKDOWN)
+    assert result["slides"][0].image_url == "https://example.com/chart.png"
+    assert len(result["warnings"]) == 1
+    assert "Multiple images" in result["warnings"][0]
+
+
+def test_fence_is_literal():
+    code = parse_markdown_to_slides(DECK_MARKDOWN)["slides"][1]
+    assert code.body_text == '\n```\n# not a heading\nprint("hi")\n```\n'
+
+
+def test_inline_markup_is_stripped():
+    links = parse_markdown_to_slides(DECK_MARKDOWN)["slides"][2]
+    assert links.body_text == "See the docs for details and `x * y`.\n"
+
+
+def test_intraword_underscores_are_kept():
+    slide = _slide("Call snake_case_name with my_var_x, _not_ __this__.\n")
+    assert slide.body_text == "Call snake_case_name with my_var_x, not this.\n"
+
+
+def test_destinations_with_parentheses():
+    slide = _slide("See [Foo](https://en.wikipedia.org/wiki/Foo_(bar) \"Foo (bar)\") here\n\n![a](http://x.com/a_(b).png)\n")
+    assert slide.image_url == "http://x.com/a_(b).png"
+    assert slide.body_text == "See Foo here\n"
+
+
+def test_image_alt_with_brackets():
+    slide = _slide("![alt [x]](http://x.com/i.png)\n[![badge](http://b.png)](http://l.com) text\n")
+    assert slide.image_url == "http://x.com/i.png"
+    assert slide.body_text == "\n text\n"
+
+
+def test_backslash_escapes():
+    slide = _slide("price \\*not emphasis\\* ok, \\_x\\_, a\\b and `a\\*b`\n")
+    assert slide.body_text == "price *not emphasis* ok, _x_, a\\b and `a\\*b`\n"
+
+
+def test_entities_are_decoded():
+    slide = _slide("a &amp; b &copy; c &#169; &bogus; &ast;x&ast;\n")
+    assert slide.body_text == "a & b © c © &bogus; *x*\n"
+
+
+def test_autolinks_keep_their_address():
+    slide = _slide("Go to <http://x.com/a_b> or mail <first_last@x.com>\n")
+    assert slide.body_text == "Go to http://x.com/a_b or mail first_last@x.com\n"
+
+
+def test_reference_links_and_definitions():
+    slide = _slide(
+        "[Docs][ref], [Home][] and [ref] but not [nope][missing]\n\n![Chart][img]\n\n"
+        "[ref]: https://r.example \"Title\"\n[home]: https://h.example\n[IMG]: <https://i.example/a b.png>\n"
+    )
+    assert slide.body_text == "Docs, Home and ref but not [nope][missing]\n"
+    assert slide.image_url == "https://i.example/a%20b.png"
+
+
+def test_raw_html_is_dropped():
+    slide = _slide(
+        "Intro\n<div>\nhidden\n</div>\n\n<!--\nnote\n\n-->\n<pre>\n\ncode\n</pre>\n"
+        "Shown <span class=\"x\">inline</span> text\n"
+    )
+    assert slide.body_text == "Intro\n\nShown inline text\n"
+
+
+def test_fenced_code_in_list_item_is_dropped():
+    slide = _slide("- item\n  ```\n  code\n  ```\n- next\n")
+    assert slide.body_text == "• item\n• next\n"
+
+
+def test_indented_code_is_dropped():
+    markdown = "# T\n\n## S\nIntro\n    continues\n\n    code line\n\n    more code\nAfter\n"
+    assert parse_markdown_to_slides(markdown)["slides"][0].body_text == "Intro\ncontinues\n\nAfter\n"
+
+
+def test_setext_headings():
+    result = parse_markdown_to_slides("Deck\n====\n\nIntro\n-----\nHello\n")
+    assert result["presentation_title"] == "Deck"
+    assert result["slides"][0].title == "Intro"
+    assert result["slides"][0].body_text == "Hello\n"
+
+
+def test_image_before_slide_warns():
+    result = parse_markdown_to_slides("# T\n\n![x](a.png)\n")
+    assert result["slides"] == []
+    assert result["warnings"] == ["Image found before any slide: a.png"]
+
+
+def test_incremental_matches_full_parse():
+    expected = parse_markdown_to_slides(DECK_MARKDOWN)
+    parser = IncrementalSlidesParser()
+    for start in range(0, len(DECK_MARKDOWN), 7):
+        parser.append(DECK_MARKDOWN[start:start + 7])
+    assert [s.title for s in parser.committed_slides] == ["Summary", "Code"]
+
+    result = parser.finalize()
+    assert result["presentation_title"] == expected["presentation_title"]
+    assert result["slides"] == expected["slides"]
+    assert result["warnings"] == expected["warnings"]
+
+
+def test_iter_slides_is_lazy():
+    slides = iter_slides(DECK_MARKDOWN)
+    assert next(slides).title == "Summary"
+    assert [s.title for s in slides] == ["Code", "Links"]
+
+
+def test_cached_parse_returns_fresh_lists():
+    first = parse_markdown_to_slides_cached(DECK_MARKDOWN)
+    first["warnings"].append("caller note")
+    first["slides"].clear()
+
+    second = parse_markdown_to_slides_cached(DECK_MARKDOWN)
+    expected = parse_markdown_to_slides(DECK_MARKDOWN)
+    assert second["slides"] == expected["slides"]
+    assert second["warnings"] == expected["warnings"]
+
+
+def test_cached_parse_lookup_does_not_parse():
+    markdown = DECK_MARKDOWN + "\n## Only parsed once\n"
+    assert get_cached_markdown_parse(markdown) is None
+
+    parsed = parse_markdown_to_slides_cached(markdown)
+    assert get_cached_markdown_parse(markdown)["slides"] == parsed["slides"]
+
+
+if __name__ == "__main__":
+    tests = [obj for name, obj in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n📊 {len(tests)} parser tests passed")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Offline tests for SlideBatchCoalescer
+
+Replaces slides_client.batch_update with a fake, so no MCP server or
+credentials are needed.
+
+Usage:
+    python tests/slides/test_slides_batch_coalescer.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from gslides import slides_client
+from gslides.slides_service import SlideBatchCoalescer
+
+
+def _service(refresh_token="refresh", client_id="client"):
+    credentials = SimpleNamespace(token=None, refresh_token=refresh_token, client_id=client_id)
+    return SimpleNamespace(_http=SimpleNamespace(credentials=credentials))
+
+
+SERVICE = _service()
+
+
+def _request(name):
+    return {"createShape": {"objectId": name}}
+
+
+def _run_batches(window, submissions, fail_with=None, services=None):
+    """
+    Submit each list of requests concurrently through a fresh coalescer.
+
+    Submissions use SERVICE unless services gives one per submission.
+
+    The fake batchUpdate answers each request with its object ID, and fails
+    with fail_with(merged) when that returns a status code.
+
+    Returns:
+        ([replies or exception per submission], [requests sent per batchUpdate call])
+    """
+    services = services or [SERVICE] * len(submissions)
+    owners = {
+        request["createShape"]["objectId"]: service
+        for service, requests in zip(services, submissions)
+        for request in requests
+    }
+    calls = []
+
+    async def batch_update(service, presentation_id, requests):
+        calls.append([request["createShape"]["objectId"] for request in requests])
+        # Every request goes out under the identity of the caller that submitted it
+        assert all(owners[name] is service for name in calls[-1])
+        status = fail_with(calls[-1]) if fail_with else None
+        if status:
+            raise HttpError(httplib2.Response({"status": status}), b"{}")
+        return {"replies": [{"objectId": name} for name in calls[-1]]}
+
+    async def main():
+        coalescer = SlideBatchCoalescer(window=window)
+        return await asyncio.gather(
+            *(
+                coalescer.submit(service, "deck", requests)
+                for service, requests in zip(services, submissions)
+            ),
+            return_exceptions=True
+        )
+
+    with mock.patch.object(slides_client, "batch_update", batch_update):
+        results = asyncio.run(main())
+    return results, calls
+
+
+def test_replies_are_sliced_per_submission():
+    results, calls = _run_batches(
+        0.01, [[_request("a")], [_request("b"), _request("c")], [_request("d")]]
+    )
+    assert calls == [["a", "b", "c", "d"]]
+    assert results == [
+        [{"objectId": "a"}],
+        [{"objectId": "b"}, {"objectId": "c"}],
+        [{"objectId": "d"}],
+    ]
+
+
+def test_invalid_batch_is_retried_per_submission():
+    results, calls = _run_batches(
+        0.01,
+        [[_request("a")], [_request("bad")], [_request("c")]],
+        fail_with=lambda names: 400 if "bad" in names else None
+    )
+    assert calls[0] == ["a", "bad", "c"]
+    assert sorted(calls[1:]) == [["a"], ["bad"], ["c"]]
+    assert results[0] == [{"objectId": "a"}]
+    assert isinstance(results[1], HttpError) and results[1].resp.status == 400
+    assert results[2] == [{"objectId": "c"}]
+
+
+def test_throttled_batch_is_not_retried():
+    results, calls = _run_batches(
+        0.01, [[_request("a")], [_request("b")]], fail_with=lambda names: 429
+    )
+    assert calls == [["a", "b"]]
+    assert all(isinstance(result, HttpError) and result.resp.status == 429 for result in results)
+
+
+def test_different_users_are_not_merged():
+    results, calls = _run_batches(
+        0.01,
+        [[_request("a")], [_request("b")], [_request("c")]],
+        services=[_service("alice"), _service("bob"), _service(None)]
+    )
+    assert sorted(calls) == [["a"], ["b"], ["c"]]
+    assert results == [[{"objectId": "a"}], [{"objectId": "b"}], [{"objectId": "c"}]]
+
+
+def test_zero_window_sends_immediately():
+    results, calls = _run_batches(0, [[_request("a")], [_request("b")]])
+    assert calls == [["a"], ["b"]]
+    assert results == [[{"objectId": "a"}], [{"objectId": "b"}]]
+
+
+if __name__ == "__main__":
+    tests = [obj for name, obj in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n📊 {len(tests)} coalescer tests passed")
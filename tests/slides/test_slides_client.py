@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Offline tests for gslides.slides_client
+
+Uses stand-in credentials, so no MCP server or network access is needed.
+
+Usage:
+    python tests/slides/test_slides_client.py
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from gslides import slides_client
+
+
+class ExpiredCredentials:
+    """Credentials that count refreshes and become valid after the first one."""
+
+    def __init__(self):
+        self.valid = False
+        self.refreshes = 0
+        self._lock = threading.Lock()
+
+    def refresh(self, request):
+        time.sleep(0.05)
+        with self._lock:
+            self.refreshes += 1
+        self.valid = True
+
+    def apply(self, headers):
+        headers['Authorization'] = 'Bearer token'
+
+
+def test_concurrent_calls_share_one_refresh():
+    credentials = ExpiredCredentials()
+
+    async def main():
+        return await asyncio.gather(*(slides_client._auth_headers(credentials) for _ in range(10)))
+
+    headers = asyncio.run(main())
+    assert credentials.refreshes == 1
+    assert all(header == {'Authorization': 'Bearer token'} for header in headers)
+    assert not slides_client._refreshes
+
+
+def test_service_without_credentials_is_rejected():
+    for service in (object(), SimpleNamespace(_http=object())):
+        try:
+            slides_client.service_credentials(service)
+        except TypeError as e:
+            assert "AuthorizedHttp" in str(e)
+        else:
+            raise AssertionError("expected TypeError")
+
+
+def test_each_event_loop_gets_its_own_client():
+    async def main():
+        return slides_client._get_client(), slides_client._get_client()
+
+    first, again = asyncio.run(main())
+    second, _ = asyncio.run(main())
+    assert first is again
+    assert second is not first
+    # The closed loop's client was dropped rather than left behind
+    assert first not in slides_client._clients.values()
+
+
+def test_ownerless_credentials_get_separate_limiters():
+    alice = ExpiredCredentials()
+    bob = ExpiredCredentials()
+    assert slides_client._get_limiter(alice) is slides_client._get_limiter(alice)
+    assert slides_client._get_limiter(alice) is not slides_client._get_limiter(bob)
+
+    anonymous = SimpleNamespace(refresh_token=None)
+    assert slides_client._get_limiter(anonymous) is not slides_client._get_limiter(anonymous)
+
+    user = SimpleNamespace(refresh_token="refresh", client_id="client")
+    same_user = SimpleNamespace(refresh_token="refresh", client_id="client")
+    assert slides_client._get_limiter(user) is slides_client._get_limiter(same_user)
+
+
+if __name__ == "__main__":
+    tests = [obj for name, obj in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n📊 {len(tests)} client tests passed")